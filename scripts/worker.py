@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Standalone worker entrypoint.
+
+Runs the job-queue consumer as its own process so the API tier and the worker
+tier scale independently (and uvicorn can run with more than one worker).
+
+Usage: python scripts/worker.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from holiday_destination_finder.config import setup_logging
+from holiday_destination_finder.worker import main
+
+if __name__ == "__main__":
+    setup_logging()
+    main()
@@ -0,0 +1,22 @@
+"""Shared synchronous Redis client.
+
+One blocking connection pool per process, shared by every module that talks
+to Redis synchronously (kv_queue, worker). Keepalive probes and periodic
+health checks weed out connections that hosted Redis providers silently drop,
+so callers never pay a TCP handshake mid-request for a stale socket.
+"""
+import os
+
+import redis
+
+# No socket_timeout here: redis-py applies it to the read of blocking
+# commands too, so any value below dequeue's BLPOP timeout would kill the
+# worker's wait mid-block. Dead peers are caught by keepalive + health checks.
+pool = redis.BlockingConnectionPool.from_url(
+    os.environ["REDIS_URL"],
+    max_connections=16,
+    socket_keepalive=True,
+    health_check_interval=30,
+    decode_responses=True,
+)
+r = redis.Redis(connection_pool=pool)
@@ -1,21 +1,40 @@
 from datetime import date
 from typing import List, Optional
+import asyncio
+import hashlib
+import hmac
+import itertools
 import json
+import multiprocessing
 import threading
 import os
 import re
 import logging
 import time
 import base64
-import urllib.request
-import urllib.parse
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+
+# pybase64 links against SIMD libbase64; fall back to the stdlib if absent
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
+import httpx
+import orjson
 import redis
+from redis.asyncio import Redis as AsyncRedis, ConnectionPool as AsyncConnectionPool
 
-from fastapi import FastAPI, Query, HTTPException, Depends, Request, Header
+from cachetools import TTLCache
+from fastapi import FastAPI, Query, HTTPException, Depends, Request, Response, Header
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, field_validator
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, field_validator
+from starlette.routing import Route
 
-from .kv_queue import enqueue, get_job, get_queue_position, cancel_job
+from .kv_queue import enqueue, get_job, get_job_with_queue_position, cancel_job
 from .worker import main as worker_main  # your existing worker loop
 from .config import setup_logging
 
@@ -31,6 +50,8 @@ try:
         touch_search_result,
         get_search_results_by_client,
         get_saved_searches_by_client,
+        get_search_results_by_clients,
+        get_saved_searches_by_clients,
         save_search_for_client,
         unsave_search_for_client,
         is_search_saved,
@@ -45,6 +66,8 @@ except ImportError:
     touch_search_result = None
     get_search_results_by_client = None
     get_saved_searches_by_client = None
+    get_search_results_by_clients = None
+    get_saved_searches_by_clients = None
     save_search_for_client = None
     unsave_search_for_client = None
     is_search_saved = None
@@ -55,8 +78,11 @@ except ImportError:
     delete_saved_search_for_client = None
     logger.warning("[api] Supabase module not available")
 
-# Redis connection for rate limiting
-_redis = redis.Redis.from_url(os.environ.get("REDIS_URL", "redis://localhost:6379"), decode_responses=True)
+# Redis connection for rate limiting: a single async pool shared by all
+# requests, created once at startup and stored on app.state.redis so Redis
+# round-trips never block the event loop.
+_REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379")
+_REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", "64"))
 
 # API Key configuration
 _API_KEY = os.environ.get("API_KEY")
@@ -65,21 +91,90 @@ _API_KEY = os.environ.get("API_KEY")
 _BROWSERLESS_API_KEY = os.environ.get("BROWSERLESS_API_KEY")
 _BROWSERLESS_ENDPOINT = "https://production-sfo.browserless.io/function"
 
+# Shared HTTP client (created at startup) - keep-alive avoids a fresh TLS
+# handshake to Browserless on every call
+_http: Optional[httpx.AsyncClient] = None
+
 # Rate limiting configuration
 RATE_LIMIT_REQUESTS = 30  # requests per window
 RATE_LIMIT_WINDOW_SECONDS = 3600  # 1 hour
 
-
-def _get_client_ip(request: Request) -> str:
+# Token-bucket rate limiter as a single atomic Lua script (one round-trip).
+# Each IP has a bucket of RATE_LIMIT_REQUESTS tokens refilled continuously at
+# limit/window tokens per ms. Unlike the previous window-based check, this
+# smooths traffic: a client can't bank a full window and fire a double burst
+# across a boundary, and rejections come with an exact wait time in ms.
+_RATE_LIMIT_LUA = """
+local key = KEYS[1]
+local now_ms = tonumber(ARGV[1])
+local cap = tonumber(ARGV[2])
+local rate_per_ms = tonumber(ARGV[3])
+local ttl_ms = tonumber(ARGV[4])
+local state = redis.call('HMGET', key, 'tk', 'ts')
+local tokens = tonumber(state[1])
+local ts = tonumber(state[2])
+if tokens == nil then tokens = cap end
+if ts == nil then ts = now_ms end
+tokens = math.min(cap, tokens + (now_ms - ts) * rate_per_ms)
+local allowed = 0
+local wait_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait_ms = math.ceil((1 - tokens) / rate_per_ms)
+end
+redis.call('HMSET', key, 'tk', tokens, 'ts', now_ms)
+redis.call('PEXPIRE', key, ttl_ms)
+return {allowed, wait_ms, math.floor(tokens)}
+"""
+
+# SHA of the preloaded script (loaded at startup, reloaded lazily if needed)
+_RATE_LIMIT_SHA: Optional[str] = None
+
+# Local fallback limiter, used only while Redis is unreachable: a per-IP,
+# per-worker token bucket so failing open still bounds abuse instead of
+# admitting unlimited traffic
+_local_buckets: TTLCache = TTLCache(maxsize=10_000, ttl=RATE_LIMIT_WINDOW_SECONDS * 2)
+_local_buckets_lock = threading.Lock()
+
+
+def _local_rate_limit(client_ip: str) -> bool:
+    """Best-effort in-process token bucket; returns True if allowed."""
+    rate = RATE_LIMIT_REQUESTS / RATE_LIMIT_WINDOW_SECONDS
+    now = time.monotonic()
+    with _local_buckets_lock:
+        tokens, last = _local_buckets.get(client_ip, (float(RATE_LIMIT_REQUESTS), now))
+        tokens = min(float(RATE_LIMIT_REQUESTS), tokens + (now - last) * rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        _local_buckets[client_ip] = (tokens, now)
+    return allowed
+
+
+def _client_ip_from_headers(request: Request) -> str:
     """Extract client IP, considering proxy headers."""
     # Check for forwarded header (common with reverse proxies like Render)
     forwarded = request.headers.get("x-forwarded-for")
     if forwarded:
-        # Take the first IP in the chain (original client)
-        return forwarded.split(",")[0].strip()
+        # Take the first IP in the chain (original client); cap the scan so an
+        # abusive multi-KB header can't cost a proportional allocation
+        return forwarded[:256].partition(",")[0].strip()
     return request.client.host if request.client else "unknown"
 
 
+def _get_client_ip(request: Request) -> str:
+    """Client IP as resolved once per request by the request_context middleware."""
+    ip = getattr(getattr(request, "state", None), "client_ip", None)
+    return ip if ip is not None else _client_ip_from_headers(request)
+
+
+# Counter for sampling invalid-key log lines, so brute-force probes can't
+# flood the logs (log 1 in 100)
+_invalid_key_counter = itertools.count()
+
+
 def verify_api_key(x_api_key: Optional[str] = Header(None, alias="X-API-Key")) -> None:
     """
     Dependency to verify API key.
@@ -97,42 +192,83 @@ def verify_api_key(x_api_key: Optional[str] = Header(None, alias="X-API-Key")) -
             detail="Missing API key. Include 'X-API-Key' header."
         )
 
-    if x_api_key != _API_KEY:
-        logger.warning("[api] Invalid API key provided")
+    # Constant-time comparison - doesn't leak key prefix length via timing.
+    # Compare as bytes: compare_digest raises TypeError on non-ASCII str
+    # input, and header values arrive latin-1 decoded, so a probe with a
+    # non-ASCII key would otherwise turn the 401 into a 500
+    if not hmac.compare_digest(x_api_key.encode("utf-8", "surrogateescape"), _API_KEY.encode()):
+        if next(_invalid_key_counter) % 100 == 0:
+            logger.warning("[api] Invalid API key provided")
         raise HTTPException(
             status_code=401,
             detail="Invalid API key."
         )
 
 
-def check_rate_limit(request: Request) -> None:
+if not _API_KEY:
+    # Dev mode: authentication is disabled for the whole process lifetime, so
+    # bind a no-op dependency instead - FastAPI then skips extracting and
+    # binding the X-API-Key header on every request just to ignore it
+    logger.debug("[api] No API_KEY configured, authentication disabled")
+
+    def verify_api_key() -> None:  # noqa: F811
+        return
+
+
+async def check_rate_limit(request: Request) -> None:
     """
     Dependency to enforce rate limiting per IP address.
-    Uses Redis to track request counts with a sliding window.
+    Uses a token bucket in Redis, evaluated atomically by a Lua script so the
+    whole check is one round-trip with no races between concurrent requests.
     """
+    global _RATE_LIMIT_SHA
     client_ip = _get_client_ip(request)
     rate_key = f"rate_limit:{client_ip}"
 
+    now_ms = int(time.time() * 1000)
+    window_ms = RATE_LIMIT_WINDOW_SECONDS * 1000
+    rate_per_ms = RATE_LIMIT_REQUESTS / window_ms
+    # Keep the bucket state around for two windows of inactivity
+    args = (now_ms, RATE_LIMIT_REQUESTS, rate_per_ms, window_ms * 2)
+
+    _redis = request.app.state.redis
     try:
-        current_count = _redis.get(rate_key)
+        if _RATE_LIMIT_SHA is None:
+            _RATE_LIMIT_SHA = await _redis.script_load(_RATE_LIMIT_LUA)
+        try:
+            allowed, wait_ms, remaining = await _redis.evalsha(_RATE_LIMIT_SHA, 1, rate_key, *args)
+        except redis.exceptions.NoScriptError:
+            # Script cache was flushed (e.g. Redis restart) - re-run via EVAL
+            allowed, wait_ms, remaining = await _redis.eval(_RATE_LIMIT_LUA, 1, rate_key, *args)
+
+        if not int(allowed):
+            retry_after_s = max(1, -(-int(wait_ms) // 1000))  # ceil to whole seconds
+            logger.warning(f"[api] Rate limit exceeded for IP {client_ip}")
+            # Standard RateLimit-* headers so clients and CDNs back off
+            # predictably instead of retry-storming
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded. Maximum {RATE_LIMIT_REQUESTS} requests per hour. Try again in {retry_after_s} seconds.",
+                headers={
+                    "Retry-After": str(retry_after_s),
+                    "RateLimit-Limit": str(RATE_LIMIT_REQUESTS),
+                    "RateLimit-Remaining": "0",
+                    "RateLimit-Reset": str(int(time.time()) + retry_after_s),
+                },
+            )
 
-        if current_count is None:
-            # First request in this window
-            _redis.setex(rate_key, RATE_LIMIT_WINDOW_SECONDS, 1)
-        else:
-            count = int(current_count)
-            if count >= RATE_LIMIT_REQUESTS:
-                ttl = _redis.ttl(rate_key)
-                logger.warning(f"[api] Rate limit exceeded for IP {client_ip}")
-                raise HTTPException(
-                    status_code=429,
-                    detail=f"Rate limit exceeded. Maximum {RATE_LIMIT_REQUESTS} requests per hour. Try again in {ttl} seconds."
-                )
-            # Increment counter
-            _redis.incr(rate_key)
+        # Stash the remaining quota for the response-header middleware
+        request.state.rate_limit_remaining = int(remaining)
     except redis.RedisError as e:
-        # If Redis fails, log but allow the request (fail open)
+        # If Redis fails, fail open - but clamp with the in-process bucket so
+        # an outage doesn't turn into unlimited admission
         logger.error(f"[api] Redis error during rate limiting: {e}")
+        if not _local_rate_limit(client_ip):
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded. Maximum {RATE_LIMIT_REQUESTS} requests per hour.",
+                headers={"Retry-After": "60"},
+            )
 
 
 # Dependency for rate-limited endpoints (only /search)
@@ -155,12 +291,19 @@ async def authenticated_endpoint(
 
 def _get_client_id(request: Request) -> Optional[str]:
     """
-    Extract client_id from header. Returns None if not provided.
+    Client ID resolved once per request by the request_context middleware.
     Client ID is optional - if not provided, some features won't work (like Personal/Shared tabs).
     """
+    state = getattr(request, "state", None)
+    if state is not None and hasattr(state, "client_id"):
+        return state.client_id
     return request.headers.get("X-Client-ID")
 
 class SearchResult(BaseModel):
+    # Frozen instances skip Pydantic's mutation machinery and hash cheaply;
+    # results are read-only once scored
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     city: str
     country: str
     airport: str
@@ -174,7 +317,52 @@ class SearchResult(BaseModel):
     best_return: str
     score: float
 
-app = FastAPI(title="Holiday Destination Finder API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _http, _RATE_LIMIT_SHA
+    # Shared HTTP client - keep-alive avoids a fresh TLS handshake per call
+    _http = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    )
+    app.state.http = _http
+
+    # One Redis connection pool for the whole process - every request shares it
+    pool = AsyncConnectionPool.from_url(
+        _REDIS_URL, max_connections=_REDIS_MAX_CONNECTIONS, decode_responses=True,
+        socket_keepalive=True, health_check_interval=30,
+    )
+    app.state.redis = AsyncRedis(connection_pool=pool)
+    try:
+        _RATE_LIMIT_SHA = await app.state.redis.script_load(_RATE_LIMIT_LUA)
+    except redis.RedisError as e:
+        logger.warning(f"[api] Could not preload rate limit script (will retry lazily): {e}")
+
+    # The worker normally runs out-of-process (scripts/worker.py, see
+    # Procfile) so heavy search jobs can't starve request handlers.
+    # EMBEDDED_WORKER=true restores single-service mode for local dev - as a
+    # child process rather than a thread, so worker CPU never contends with
+    # request handling for the GIL; it inherits env vars on fork/spawn. Run
+    # uvicorn with --workers 1 in that mode or you will spawn duplicates.
+    worker_proc = None
+    if os.environ.get("EMBEDDED_WORKER", "").lower() == "true":
+        worker_proc = multiprocessing.Process(target=worker_main, daemon=True)
+        worker_proc.start()
+
+    yield
+
+    if worker_proc is not None and worker_proc.is_alive():
+        worker_proc.terminate()
+    await _http.aclose()
+    try:
+        await app.state.redis.aclose()
+    except Exception as e:
+        logger.debug(f"[api] Error closing Redis client: {e}")
+
+
+# orjson serializes the large result arrays in C, 3-5x faster than stdlib json
+app = FastAPI(title="Holiday Destination Finder API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # CORS configuration - restrict to known frontend origins
 _default_origins = [
@@ -182,9 +370,38 @@ _default_origins = [
     "http://localhost:3000",
     "http://127.0.0.1:3000",
 ]
-# Allow override via environment variable (comma-separated list)
+# Allow override via environment variable (comma-separated list); strip and
+# drop empty entries once here so CORSMiddleware compares clean strings
 _env_origins = os.getenv("CORS_ORIGINS")
-_allowed_origins = _env_origins.split(",") if _env_origins else _default_origins
+_allowed_origins = [
+    o.strip()
+    for o in (_env_origins.split(",") if _env_origins else _default_origins)
+    if o.strip()
+]
+
+@app.middleware("http")
+async def request_context(request: Request, call_next):
+    """
+    Resolve per-request identity (client IP + client ID) once and stash it on
+    request.state, so dependencies don't re-parse headers; also attach
+    RateLimit-* headers on rate-limited endpoints' success path.
+    """
+    headers = request.headers
+    forwarded = headers.get("x-forwarded-for")
+    request.state.client_ip = (
+        forwarded[:256].partition(",")[0].strip()
+        if forwarded
+        else (request.client.host if request.client else "unknown")
+    )
+    request.state.client_id = headers.get("x-client-id")
+
+    response = await call_next(request)
+    remaining = getattr(request.state, "rate_limit_remaining", None)
+    if remaining is not None:
+        response.headers["RateLimit-Limit"] = str(RATE_LIMIT_REQUESTS)
+        response.headers["RateLimit-Remaining"] = str(remaining)
+    return response
+
 
 app.add_middleware(
     CORSMiddleware,
@@ -194,19 +411,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.on_event("startup")
-def start_embedded_worker():
-    # IMPORTANT: run uvicorn with --workers 1, otherwise you spawn multiple worker threads
-    t = threading.Thread(target=worker_main, daemon=True)
-    t.start()
+# Health probes hit this endpoint several times a second for the lifetime of
+# the container; serve a precomputed response from a raw ASGI endpoint so the
+# probe skips dependency resolution and response serialization entirely.
+_HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+]
+
+
+class _HealthEndpoint:
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+        await send({"type": "http.response.body", "body": _HEALTH_BODY})
+
+
+app.router.routes.insert(0, Route("/health", _HealthEndpoint()))
 
-@app.get("/health")
-def health():
-    return {"status": "ok"}
+# Input validation helpers (compiled once at module load - these run on the
+# event loop thread for every /search call)
+# re.ASCII skips Unicode property lookups - kgmids are ASCII by definition
+_KGMID_PATTERN = re.compile(r"^/(m|g)/[A-Za-z0-9_]+$", re.IGNORECASE | re.ASCII)
 
-# Input validation helpers
-_IATA_PATTERN = re.compile(r"^[A-Z]{3}$")
-_VALID_PROVIDERS = {"amadeus", "ryanair", "wizzair", "serpapi"}
+
+def _is_iata(s: str) -> bool:
+    """True for a 3-letter uppercase ASCII code; cheaper than a regex."""
+    return len(s) == 3 and s.isascii() and s.isalpha() and s.isupper()
+_VALID_PROVIDERS = frozenset({"amadeus", "ryanair", "wizzair", "serpapi"})
+_VALID_PROVIDERS_SORTED = sorted(_VALID_PROVIDERS)
 
 def _validate_origin(origin: str) -> str:
     """Validate origin - can be IATA code or kgmid (country/city)."""
@@ -214,7 +447,7 @@ def _validate_origin(origin: str) -> str:
 
     # If it's a kgmid, validate format
     if origin.startswith('/'):
-        if not re.match(r"^/(m|g)/[A-Za-z0-9_]+$", origin, re.IGNORECASE):
+        if not _KGMID_PATTERN.match(origin):
             raise HTTPException(
                 status_code=422,
                 detail=f"Invalid Google ID '{origin}': must start with /m/ or /g/"
@@ -223,7 +456,7 @@ def _validate_origin(origin: str) -> str:
 
     # Otherwise treat as IATA
     origin = origin.upper()
-    if not _IATA_PATTERN.match(origin):
+    if not _is_iata(origin):
         raise HTTPException(
             status_code=422,
             detail=f"Invalid origin '{origin}': must be a 3-letter IATA airport code (e.g., WRO, LHR, JFK) or a Google ID (e.g., /m/05qhw)"
@@ -257,18 +490,24 @@ def _validate_trip_length(trip_length: int) -> int:
         raise HTTPException(status_code=422, detail="trip_length cannot exceed 30 days")
     return trip_length
 
+@lru_cache(maxsize=64)
+def _norm_providers(key: tuple) -> tuple:
+    """Normalize a provider tuple; cached since only a handful of
+    combinations ever occur (invalid inputs are not cached by lru_cache)."""
+    normalized = {p.strip().lower() for p in key if p.strip()}
+    if not normalized <= _VALID_PROVIDERS:
+        invalid = sorted(normalized - _VALID_PROVIDERS)
+        raise ValueError(f"Invalid providers: {invalid}. Valid options: {_VALID_PROVIDERS_SORTED}")
+    if not normalized:
+        raise ValueError("At least one provider must be specified")
+    return tuple(sorted(normalized))
+
 def _validate_providers(providers: List[str]) -> List[str]:
     """Validate and normalize provider list."""
-    normalized = [p.strip().lower() for p in providers if p.strip()]
-    invalid = [p for p in normalized if p not in _VALID_PROVIDERS]
-    if invalid:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Invalid providers: {invalid}. Valid options: {sorted(_VALID_PROVIDERS)}"
-        )
-    if not normalized:
-        raise HTTPException(status_code=422, detail="At least one provider must be specified")
-    return normalized
+    try:
+        return list(_norm_providers(tuple(providers)))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
 def _validate_top_n(top_n: int) -> int:
     """Validate top_n bounds."""
@@ -312,28 +551,97 @@ def search(
     job_id = enqueue(params, client_id=client_id)
     return {"job_id": job_id}
 
+# Per-process cache of finished jobs: repeated polls of a terminal job (the
+# common case when users leave the tab open) return without any network I/O
+_JOB_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=60)
+_TERMINAL_STATUSES = {"done", "failed", "cancelled"}
+
+# Short-TTL caches for read-mostly Supabase lookups; polls arrive sub-second
+# so even 30 s of caching absorbs nearly all repeat reads. Invalidated
+# explicitly by the save/unsave/rename handlers. TTLCache is not thread-safe
+# and these are touched from both the event loop and FastAPI's threadpool
+# (the sync handlers), so every access goes through the lock.
+_SB_JOB_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_SB_SAVED_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_sb_cache_lock = threading.Lock()
+
+
+def _splice_payload(out: dict, result_str: str) -> bytes:
+    """
+    Build the response body for a finished job without ever parsing the stored
+    result. The worker already wrote the payload as JSON, so serializing the
+    small envelope and splicing the stored bytes in as the ``payload`` field
+    skips a decode/re-encode of what can be tens of KB per poll.
+    """
+    head = orjson.dumps(out)
+    return head[:-1] + b',"payload":' + result_str.encode() + b"}"
+
+
+@lru_cache(maxsize=1024)
+def _result_etag(result_str: str) -> str:
+    """
+    Content hash of the result blob for If-None-Match polling, DQUOTE-wrapped
+    to match RFC 9110 entity-tag syntax and the form set_done stores.
+    """
+    return '"{}"'.format(hashlib.blake2b(result_str.encode(), digest_size=8).hexdigest())
+
+
 @app.get("/jobs/{job_id}", dependencies=[Depends(authenticated_endpoint)])
-def job(job_id: str):
-    # Check Redis first (fast path for recently created/active jobs)
-    data = get_job(job_id)
-    
-    # If not in Redis, check Supabase (for jobs that expired from Redis but still exist in Supabase)
-    if not data and get_search_result:
+async def job(job_id: str, request: Request, response: Response):
+    # Fast path: finished jobs are cached in-process
+    cached = _JOB_CACHE.get(job_id)
+    if cached is not None:
+        out, etag = cached
+        if etag and request.headers.get("if-none-match") == etag:
+            # Payload unchanged since the client's last poll - skip the body
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        if isinstance(out, bytes):
+            # Finished job with a payload: pre-spliced bytes, served as-is
+            return Response(content=out, media_type="application/json",
+                            headers={"ETag": etag, "Cache-Control": "no-cache"})
+        if etag:
+            response.headers["ETag"] = etag
+            response.headers["Cache-Control"] = "no-cache"
+        return out
+
+    async def _fetch_supabase():
+        if not get_search_result:
+            return None
+        with _sb_cache_lock:
+            cached_result = _SB_JOB_CACHE.get(job_id)
+        if cached_result is not None:
+            return cached_result
         try:
-            supabase_result = get_search_result(job_id, update_ttl=True)
-            if supabase_result:
-                # Convert Supabase format to Redis format for consistency
-                data = {
-                    "status": supabase_result.get("status", "done"),
-                    "params": json.dumps(supabase_result.get("params", {})),
-                }
-                if supabase_result.get("result"):
-                    data["result"] = json.dumps(supabase_result["result"]) if isinstance(supabase_result["result"], dict) else supabase_result["result"]
-                if supabase_result.get("error"):
-                    data["error"] = supabase_result["error"]
+            # Supabase SDK is sync - run it off the event loop
+            result = await asyncio.to_thread(get_search_result, job_id, update_ttl=True)
+            if result is not None:
+                with _sb_cache_lock:
+                    _SB_JOB_CACHE[job_id] = result
+            return result
         except Exception as e:
             logger.error(f"[api] Error fetching from Supabase for job {job_id}: {e}")
-    
+            return None
+
+    # Issue both lookups concurrently instead of Redis-then-Supabase serially;
+    # the Redis side pipelines the job hash + queue position into one RTT
+    (data, queue_position), supabase_result = await asyncio.gather(
+        asyncio.to_thread(get_job_with_queue_position, job_id),
+        _fetch_supabase(),
+    )
+
+    # Prefer Redis (fast path for recently created/active jobs); fall back to
+    # Supabase for jobs that expired from Redis but are still persisted there
+    if not data and supabase_result:
+        # Convert Supabase format to Redis format for consistency
+        data = {
+            "status": supabase_result.get("status", "done"),
+            "params": json.dumps(supabase_result.get("params", {})),
+        }
+        if supabase_result.get("result"):
+            data["result"] = json.dumps(supabase_result["result"]) if isinstance(supabase_result["result"], dict) else supabase_result["result"]
+        if supabase_result.get("error"):
+            data["error"] = supabase_result["error"]
+
     if not data:
         raise HTTPException(status_code=404, detail="Job not found (expired or restarted)")
 
@@ -341,8 +649,7 @@ def job(job_id: str):
     out = {"job_id": job_id, "status": status}
     
     if status == "queued":
-        # Get queue position for queued jobs
-        queue_position = get_queue_position(job_id)
+        # Queue position was fetched in the same pipeline as the job hash
         if queue_position is not None:
             out["queue_position"] = queue_position
         # If queue_position is None, job might have just been popped or queue is empty
@@ -370,13 +677,62 @@ def job(job_id: str):
             except ValueError:
                 pass
 
+    etag = None
+    if "result" not in data and status in ("queued", "running"):
+        # Weak ETag over the progress fields: while nothing has changed
+        # between polls the client gets an empty 304 instead of a re-encoded
+        # body, which is the common case at 1-2s polling intervals
+        etag = 'W/"{}:{}:{}:{}"'.format(
+            status, data.get("processed", ""), data.get("current", ""),
+            queue_position if status == "queued" else "",
+        )
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "no-cache"
     if "result" in data:
-        out["payload"] = json.loads(data["result"])
+        # Prefer the etag computed at write time; hash only for rows predating it
+        etag = data.get("etag") or _result_etag(data["result"])
+        if "error" in data:
+            out["error"] = data["error"]
+        # Zero-parse passthrough: splice the stored result bytes straight into
+        # the envelope rather than decoding and re-encoding them per poll
+        body = _splice_payload(out, data["result"])
+        if status in _TERMINAL_STATUSES:
+            _JOB_CACHE[job_id] = (body, etag)
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        return Response(content=body, media_type="application/json",
+                        headers={"ETag": etag, "Cache-Control": "no-cache"})
     if "error" in data:
         out["error"] = data["error"]
-    
+
+    if status in _TERMINAL_STATUSES:
+        _JOB_CACHE[job_id] = (out, etag)
+
     return out
 
+@app.get("/jobs/{job_id}/payload", dependencies=[Depends(authenticated_endpoint)])
+async def job_payload(job_id: str):
+    """
+    Return the stored result JSON verbatim. The blob is already serialized at
+    write time, so this skips the decode+encode cycle of /jobs/{job_id}.
+    """
+    data = await asyncio.to_thread(get_job, job_id)
+    if data and data.get("result"):
+        return Response(content=data["result"], media_type="application/json")
+
+    # Fall back to Supabase for jobs that expired from Redis
+    if get_search_result:
+        supabase_result = await asyncio.to_thread(get_search_result, job_id, update_ttl=True)
+        if supabase_result and supabase_result.get("result"):
+            result = supabase_result["result"]
+            content = result if isinstance(result, str) else orjson.dumps(result)
+            return Response(content=content, media_type="application/json")
+
+    raise HTTPException(status_code=404, detail="Job result not found")
+
+
 @app.post("/jobs/{job_id}/cancel", dependencies=[Depends(authenticated_endpoint)])
 def cancel(job_id: str):
     success = cancel_job(job_id)
@@ -387,8 +743,53 @@ def cancel(job_id: str):
 
 # New endpoints for Supabase-backed features
 
+class _CoalescingLoader:
+    """
+    Buffers keys arriving within a short window and resolves them with one
+    batched lookup (DataLoader pattern). Concurrent /jobs polls from different
+    clients collapse into a single Supabase IN query instead of N round-trips.
+    """
+
+    def __init__(self, batch_fn, window_s: float = 0.01, max_batch_size: int = 50):
+        self._batch_fn = batch_fn  # sync fn: list[key] -> dict[key, value]
+        self._window_s = window_s
+        self._max_batch_size = max_batch_size
+        self._pending: dict = {}
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    async def load(self, key):
+        loop = asyncio.get_running_loop()
+        future = self._pending.get(key)
+        if future is None:
+            future = loop.create_future()
+            self._pending[key] = future
+            if self._dispatch_task is None or self._dispatch_task.done():
+                self._dispatch_task = loop.create_task(self._dispatch())
+        return await future
+
+    async def _dispatch(self):
+        await asyncio.sleep(self._window_s)
+        while self._pending:
+            keys = list(self._pending.keys())[:self._max_batch_size]
+            futures = [self._pending.pop(k) for k in keys]
+            try:
+                by_key = await asyncio.to_thread(self._batch_fn, keys)
+            except Exception as e:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for key, future in zip(keys, futures):
+                if not future.done():
+                    future.set_result(by_key.get(key, []))
+
+
+_personal_loader = _CoalescingLoader(get_search_results_by_clients) if get_search_results_by_clients else None
+_shared_loader = _CoalescingLoader(get_saved_searches_by_clients) if get_saved_searches_by_clients else None
+
+
 @app.get("/jobs", dependencies=[Depends(authenticated_endpoint)])
-def get_jobs(
+async def get_jobs(
     request: Request,
     type: str = Query("personal", description="Type of jobs to fetch: 'personal' or 'shared'")
 ):
@@ -399,16 +800,16 @@ def get_jobs(
     client_id = _get_client_id(request)
     if not client_id:
         return []
-    
-    if not get_search_results_by_client or not get_saved_searches_by_client:
+
+    if not _personal_loader or not _shared_loader:
         raise HTTPException(status_code=503, detail="Supabase is not configured")
-    
+
     try:
         if type == "shared":
-            results = get_saved_searches_by_client(client_id)
+            results = await _shared_loader.load(client_id)
         else:  # type == "personal"
-            results = get_search_results_by_client(client_id)
-        
+            results = await _personal_loader.load(client_id)
+
         # Convert to API format
         jobs = []
         for result in results:
@@ -447,7 +848,9 @@ def save_job(
     success = save_search_for_client(client_id, job_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to save search")
-    
+
+    with _sb_cache_lock:
+        _SB_SAVED_CACHE[(client_id, job_id)] = True
     return {"status": "saved", "job_id": job_id}
 
 
@@ -467,7 +870,9 @@ def unsave_job(
     success = unsave_search_for_client(client_id, job_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to unsave search")
-    
+
+    with _sb_cache_lock:
+        _SB_SAVED_CACHE[(client_id, job_id)] = False
     return {"status": "unsaved", "job_id": job_id}
 
 
@@ -483,8 +888,14 @@ def check_saved(
     
     if not is_search_saved:
         raise HTTPException(status_code=503, detail="Supabase is not configured")
-    
-    saved = is_search_saved(client_id, job_id)
+
+    cache_key = (client_id, job_id)
+    with _sb_cache_lock:
+        saved = _SB_SAVED_CACHE.get(cache_key)
+    if saved is None:
+        saved = is_search_saved(client_id, job_id)
+        with _sb_cache_lock:
+            _SB_SAVED_CACHE[cache_key] = saved
     return {"saved": saved}
 
 
@@ -517,7 +928,11 @@ def rename_job(
             raise HTTPException(status_code=404, detail="Saved search not found")
         else:
             raise HTTPException(status_code=403, detail="You can only rename your own searches")
-    
+
+    # The cached Supabase row carries custom_name - drop it so the next poll
+    # sees the rename
+    with _sb_cache_lock:
+        _SB_JOB_CACHE.pop(job_id, None)
     return {"status": "updated", "job_id": job_id, "custom_name": rename_request.custom_name}
 
 
@@ -585,49 +1000,129 @@ def delete_saved_job(
 # Google Flights URL builder and Browserless.io integration
 # ============================================================================
 
+# Precomputed single-byte varints: almost every value encoded here (field
+# tags, location types, short inner lengths) fits in one byte
+_SINGLE_BYTE = tuple(bytes((i,)) for i in range(128))
+
+
 def _encode_varint(n: int) -> bytes:
     """Encode an integer as a protobuf varint."""
-    result = []
+    if n < 128:
+        return _SINGLE_BYTE[n]
+    # Straight-line writes bucketed by bit length; no loop, list, or
+    # per-byte append for anything under four bytes
+    bl = n.bit_length()
+    if bl <= 14:
+        return bytes(((n & 0x7f) | 0x80, n >> 7))
+    if bl <= 21:
+        return bytes(((n & 0x7f) | 0x80, ((n >> 7) & 0x7f) | 0x80, n >> 14))
+    if bl <= 28:
+        return bytes(((n & 0x7f) | 0x80, ((n >> 7) & 0x7f) | 0x80,
+                      ((n >> 14) & 0x7f) | 0x80, n >> 21))
+    ba = bytearray()
+    while n > 127:
+        ba.append((n & 0x7f) | 0x80)
+        n >>= 7
+    ba.append(n)
+    return bytes(ba)
+
+
+def _encode_varint_into(buf: bytearray, n: int) -> None:
+    """Append a protobuf varint to a caller-supplied buffer."""
     while n > 127:
-        result.append((n & 0x7f) | 0x80)
+        buf.append((n & 0x7f) | 0x80)
         n >>= 7
-    result.append(n)
-    return bytes(result)
+    buf.append(n)
+
+
+# Single-byte wire tags (wire type 2) for the fields this module emits
+_TAG = {f: bytes(((f << 3) | 2,)) for f in (2, 3, 10, 13, 14)}
 
 
 def _encode_string(field_num: int, s: str) -> bytes:
     """Encode a string as a protobuf field."""
-    encoded = s.encode('utf-8')
-    return bytes([field_num << 3 | 2]) + _encode_varint(len(encoded)) + encoded
-
+    # Dates, IATA codes, kgmids and currency are ASCII by construction
+    encoded = s.encode('ascii')
+    return _TAG[field_num] + _encode_varint(len(encoded)) + encoded
 
-def _encode_location(field_num: int, loc_type: int, kgmid_or_iata: str) -> bytes:
-    """Encode a location (airport/city/country) as protobuf."""
-    inner = bytes([0x08, loc_type]) + _encode_string(2, kgmid_or_iata)
-    return bytes([field_num << 3 | 2]) + _encode_varint(len(inner)) + inner
 
+def _write_string(buf: bytearray, field_num: int, s: str) -> None:
+    """Append a string field to a shared buffer."""
+    encoded = s.encode('ascii')
+    buf.append(field_num << 3 | 2)
+    _encode_varint_into(buf, len(encoded))
+    buf += encoded
 
-def _encode_leg(date_str: str, origin_type: int, origin: str, dest_type: int, dest: str) -> bytes:
-    """Encode a flight leg (outbound or return) as protobuf."""
-    inner = _encode_string(2, date_str) + _encode_location(13, origin_type, origin) + _encode_location(14, dest_type, dest)
-    return bytes([0x1a]) + _encode_varint(len(inner)) + inner
 
+def _patch_len(buf: bytearray, len_pos: int) -> None:
+    """Back-patch a reserved one-byte length prefix, growing it if needed.
 
-def _get_location_type(location: str) -> int:
+    Message lengths here (dates, IATA codes, kgmids) always fit in one
+    byte; the slow path only exists so an oversized input can never emit
+    a corrupt varint.
     """
-    Determine the protobuf location type:
-    - 1 = IATA airport code
-    - 2 = country kgmid
-    - 3 = city kgmid
-    """
-    if location.startswith('/m/') or location.startswith('/g/'):
-        # Heuristic: country kgmids are typically shorter
-        # This is a simplification - in practice we'd need a lookup
-        # For now, treat all kgmids as type 2 (country) for origin, type 3 for cities
-        return 2  # Will be overridden by caller if needed
-    return 1  # IATA code
+    length = len(buf) - len_pos - 1
+    if length < 128:
+        buf[len_pos] = length
+    else:
+        buf[len_pos:len_pos + 1] = _encode_varint(length)
 
 
+def _write_location(buf: bytearray, field_num: int, loc_type: int, kgmid_or_iata: str) -> None:
+    """Append a location (airport/city/country) message to a shared buffer.
+
+    The message layout is fixed ([tag][len][0x08 type][0x12 slen][code]),
+    so lengths are computed up front instead of back-patched.
+    """
+    encoded = kgmid_or_iata.encode('ascii')
+    slen = len(encoded)
+    if slen > 123:
+        # Generic path for (never-seen) codes whose message needs a wide varint
+        buf.append(field_num << 3 | 2)
+        len_pos = len(buf)
+        buf.append(0)  # length placeholder
+        buf.append(0x08)
+        buf.append(loc_type)
+        _write_string(buf, 2, kgmid_or_iata)
+        _patch_len(buf, len_pos)
+        return
+    buf.append(field_num << 3 | 2)
+    buf.append(4 + slen)
+    buf.append(0x08)
+    buf.append(loc_type)
+    buf.append(0x12)
+    buf.append(slen)
+    buf += encoded
+
+
+@lru_cache(maxsize=512)
+def _location_field(field_num: int, loc_type: int, kgmid_or_iata: str) -> bytes:
+    """Fully encoded location field; the same few airports and kgmids recur
+    on every request, so cache the built bytes."""
+    buf = bytearray()
+    _write_location(buf, field_num, loc_type, kgmid_or_iata)
+    return bytes(buf)
+
+
+def _write_leg(buf: bytearray, date_str: str, origin_type: int, origin: str, dest_type: int, dest: str) -> None:
+    """Append a flight leg (outbound or return) message to a shared buffer."""
+    buf.append(0x1a)
+    len_pos = len(buf)
+    buf.append(0)  # length placeholder
+    _write_string(buf, 2, date_str)
+    buf += _location_field(13, origin_type, origin)
+    buf += _location_field(14, dest_type, dest)
+    _patch_len(buf, len_pos)
+
+
+# Invariant sections of the tfs payload, computed once at import
+_TFS_HEADER = bytes((0x08, 0x1b, 0x10, 0x02))
+_TFS_FOOTER_A = bytes((0x40, 0x01, 0x48, 0x01))
+_TFS_FOOTER_B = bytes((0x70, 0x01))
+_TFS_CURRENCY = _encode_string(10, "EUR")
+
+
+@lru_cache(maxsize=4096)
 def build_google_flights_tfs(
     origin: str,
     destination: str,
@@ -656,246 +1151,56 @@ def build_google_flights_tfs(
     if dest_type is None:
         dest_type = 3 if destination.startswith('/') else 1
 
-    # Build protobuf
-    tfs = bytes([0x08, 0x1b, 0x10, 0x02])  # header
+    # Build protobuf into a single buffer to avoid per-field bytes copies
+    tfs = bytearray(_TFS_HEADER)
 
     # Outbound leg
-    tfs += _encode_leg(departure_date, origin_type, origin, dest_type, destination)
+    _write_leg(tfs, departure_date, origin_type, origin, dest_type, destination)
 
     # Return leg (swap origin and destination)
-    tfs += _encode_leg(return_date, dest_type, destination, origin_type, origin)
+    _write_leg(tfs, return_date, dest_type, destination, origin_type, origin)
 
     # Footer
-    tfs += bytes([0x40, 0x01, 0x48, 0x01])
-    tfs += _encode_string(10, "EUR")
-    tfs += bytes([0x70, 0x01])
+    tfs += _TFS_FOOTER_A
+    tfs += _TFS_CURRENCY
+    tfs += _TFS_FOOTER_B
 
     # Base64 encode (URL-safe, no padding)
-    return base64.urlsafe_b64encode(tfs).decode('utf-8').rstrip('=')
+    return _b64.urlsafe_b64encode(bytes(tfs)).decode('utf-8').rstrip('=')
 
 
+@lru_cache(maxsize=4096)
 def build_google_flights_url(origin: str, destination: str, departure_date: str, return_date: str) -> str:
     """Build a complete Google Flights URL."""
     tfs = build_google_flights_tfs(origin, destination, departure_date, return_date)
     return f"https://www.google.com/travel/flights?hl=en&gl=us&curr=EUR&tfs={tfs}"
 
 
-# Puppeteer code to extract the cheapest departure airport from Google Flights
-_BROWSERLESS_FUNCTION_CODE = '''
-export default async function ({ page, context }) {
-    const { url, timeout = 25000, debug = false } = context;
+# The puppeteer script that extracts the cheapest departure airport from
+# Google Flights lives in a sibling .js file, so the multi-kilobyte blob is
+# never materialized as a wide str constant in this module
+_BROWSERLESS_FUNCTION_CODE_PATH = Path(__file__).parent / 'browserless_resolve.js'
 
-    try {
-        // Navigate to Google Flights
-        await page.goto(url, { waitUntil: 'networkidle2', timeout });
 
-        // Wait for dynamic content to load - flight prices take time
-        await new Promise(r => setTimeout(r, 5000));
+def _minify_js(code: str) -> str:
+    """Line-based minifier: drop blank and comment-only lines plus leading
+    indentation. Lines are kept intact so string and template literals
+    (which can contain '//') are never touched."""
+    kept = []
+    for line in code.split('\n'):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('//'):
+            continue
+        kept.append(stripped)
+    return '\n'.join(kept)
 
-        // Try to bring "Top departing flights" into view to force render
-        await page.evaluate(() => {
-            const candidates = Array.from(document.querySelectorAll('div, span'));
-            const target = candidates.find(el => (el.textContent || '').includes('Top departing flights'));
-            if (target && target.scrollIntoView) {
-                target.scrollIntoView({ block: 'center' });
-            } else {
-                window.scrollTo(0, Math.floor(document.body.scrollHeight * 0.5));
-            }
-        });
-
-        await new Promise(r => setTimeout(r, 2000));
-
-        // Look for the "Fly from" / "cheaper from" notification or extract the displayed origin
-        const result = await page.evaluate((destination) => {
-            const bodyText = document.body.innerText;
-            const dest = (destination || '').toUpperCase();
-
-            const collectCandidateTexts = () => {
-                const nodes = [
-                    ...document.querySelectorAll('[role="status"], [role="alert"], [aria-live], [role="tooltip"], [aria-label], [title]')
-                ];
-                return nodes
-                    .map(el => el.getAttribute('aria-label') || el.getAttribute('title') || el.textContent || '')
-                    .filter(Boolean);
-            };
-
-            // Strategy 1: Look for "Fly from XXX for €YY" notification/banner
-            // This appears when Google suggests a cheaper departure airport
-            const notificationTextCandidates = collectCandidateTexts();
-            const notificationText = notificationTextCandidates.join(' ');
-
-            const flyFromPatterns = [
-                /Fly from\\s+([A-Z]{3})\\s+for\\s+([€$£]?\\s*\\d+|\\d+\\s*[€$£])/i,
-                /\\bfrom\\s+([A-Z]{3})\\s+for\\s+([€$£]?\\s*\\d+|\\d+\\s*[€$£])/i,
-            ];
-
-            for (const pattern of flyFromPatterns) {
-                const match = notificationText.match(pattern) || bodyText.match(pattern);
-                if (match) {
-                    return { airport: match[1], source: 'fly_from_notification' };
-                }
-            }
 
-            // Strategy 1b: Look for explicit data-iata-code on "Change airport" CTA
-            const changeAirportIata = document.querySelector('[data-is-origin="true"][data-iata-code]') ||
-                document.querySelector('[data-iata-code]');
-            if (changeAirportIata) {
-                const iata = changeAirportIata.getAttribute('data-iata-code');
-                if (iata && /^[A-Z]{3}$/.test(iata)) {
-                    return { airport: iata, source: 'change_airport_data' };
-                }
-            }
-
-            // Strategy 2: Look for "cheaper from XXX" notification/banner
-            const cheaperPatterns = [
-                /(?:from|From)\\s+([A-Z]{3})\\s+(?:is|are|would be)\\s+cheaper/i,
-                /[Ff]lights?\\s+from\\s+([A-Z]{3})\\s+are\\s+[€$£]?\\d+\\s+cheaper/i,
-                /[Cc]heaper\\s+from\\s+([A-Z]{3})/i,
-                /[Ss]ave\\s+[€$£]?\\d+.*?from\\s+([A-Z]{3})/i
-            ];
-
-            for (const pattern of cheaperPatterns) {
-                const match = bodyText.match(pattern);
-                if (match) {
-                    return { airport: match[1], source: 'cheaper_suggestion' };
-                }
-            }
-
-            // Strategy 3: Look for the origin airport in the search form
-            // The input field shows the currently selected origin
-            const originInputs = document.querySelectorAll('input[placeholder*="Where from"], input[aria-label*="Where from"], input[aria-label*="origin" i], input[aria-label*="departure" i]');
-            for (const input of originInputs) {
-                const text = input.value || input.textContent || '';
-                const iataMatch = text.match(/\\b([A-Z]{3})\\b/);
-                if (iataMatch) {
-                    return { airport: iataMatch[1], source: 'origin_input' };
-                }
-            }
+# Minify and JSON-escape the ~5 KB function body once at import; per-call
+# bodies are spliced around it so only the small context dict is serialized
+_CODE_JSON_BYTES = orjson.dumps(_minify_js(_BROWSERLESS_FUNCTION_CODE_PATH.read_text(encoding='utf-8')))
 
-            // Strategy 4: Look for departure airport in displayed flight cards
-            // Flight cards show "WAW – VLC" or "WAW-VLC" format
-            const flightRoutePattern = /\\b([A-Z]{3})\\s*[–—-]\\s*([A-Z]{3})\\b/;
-            const candidateTexts = collectCandidateTexts().concat([bodyText]);
-            const routeCandidates = [];
-            for (const text of candidateTexts) {
-                const match = text.match(flightRoutePattern);
-                if (match) {
-                    routeCandidates.push(match);
-                }
-            }
-            if (routeCandidates.length > 0) {
-                return { airport: routeCandidates[0][1], source: 'flight_route' };
-            }
-
-            // Strategy 5: Look near "Change airport" tooltip text
-            const changeAirportNodes = Array.from(document.querySelectorAll('*'))
-                .filter(el => (el.textContent || '').includes('Change airport'))
-                .slice(0, 5);
-
-            for (const node of changeAirportNodes) {
-                const text = node.textContent || '';
-                const match = text.match(/\\bfrom\\s+([A-Z]{3})\\b/i);
-                if (match) {
-                    return { airport: match[1], source: 'change_airport_tooltip' };
-                }
-            }
 
-            // Strategy 6: Scan script payloads for origin/destination pairs
-            if (dest) {
-                const scriptTexts = Array.from(document.querySelectorAll('script'))
-                    .map(script => script.textContent || '')
-                    .filter(Boolean);
-                const pairPattern = new RegExp(`\\b([A-Z]{3})\\b[^A-Z]{0,40}\\b${dest}\\b`);
-                for (const text of scriptTexts) {
-                    const match = text.match(pairPattern);
-                    if (match) {
-                        return { airport: match[1], source: 'script_pair' };
-                    }
-                }
-            }
-
-            return null;
-        }, context.destination);
-
-        if (!result && debug) {
-            const debugInfo = await page.evaluate(() => {
-                const limitText = (text, max = 2000) => {
-                    if (!text) return text;
-                    return text.length > max ? text.slice(0, max) + '…' : text;
-                };
-
-                const candidates = Array.from(
-                    document.querySelectorAll('[role="status"], [role="alert"], [aria-live], [role="tooltip"], [aria-label], [title]')
-                )
-                    .map(el => el.getAttribute('aria-label') || el.getAttribute('title') || el.textContent || '')
-                    .filter(Boolean);
-
-                const interesting = candidates.filter(text =>
-                    /(Fly from|cheaper from|from\\s+[A-Z]{3}|Change airport)/i.test(text)
-                );
-
-                const dataIataElements = Array.from(document.querySelectorAll('[data-iata-code]'))
-                    .map(el => ({
-                        iata: el.getAttribute('data-iata-code'),
-                        is_origin: el.getAttribute('data-is-origin'),
-                        text: (el.textContent || '').trim()
-                    }))
-                    .slice(0, 10);
-
-                const originInputs = Array.from(
-                    document.querySelectorAll('input[placeholder*="Where from"], input[aria-label*="Where from"], input[aria-label*="origin" i], input[aria-label*="departure" i]')
-                )
-                    .map(input => input.value || input.textContent || '')
-                    .filter(Boolean);
-
-                const bodyText = document.body.innerText || '';
-                const routeMatches = [...bodyText.matchAll(/\\b([A-Z]{3})\\s*[–—-]\\s*[A-Z]{3}\\b/g)]
-                    .slice(0, 3)
-                    .map(match => match[0]);
-
-                const changeAirportNode = Array.from(document.querySelectorAll('*'))
-                    .find(el => (el.textContent || '').includes('Change airport'));
-
-                const topDepartingNode = Array.from(document.querySelectorAll('*'))
-                    .find(el => (el.textContent || '').includes('Top departing flights'));
-
-                return {
-                    candidate_snippets: interesting.slice(0, 8),
-                    data_iata_elements: dataIataElements,
-                    origin_inputs: originInputs.slice(0, 5),
-                    route_matches: routeMatches,
-                    change_airport_html: changeAirportNode ? limitText(changeAirportNode.outerHTML) : null,
-                    top_departing_html: topDepartingNode ? limitText(topDepartingNode.outerHTML) : null,
-                };
-            });
-
-            return {
-                data: { airport: null, error: 'No airport match found', debug: debugInfo },
-                type: 'application/json'
-            };
-        }
-
-        if (result) {
-            return { data: result, type: 'application/json' };
-        }
-
-        // No airport found
-        return {
-            data: { airport: null, error: 'Could not find departure airport in page' },
-            type: 'application/json'
-        };
-
-    } catch (error) {
-        return {
-            data: { airport: null, error: error.message },
-            type: 'application/json'
-        };
-    }
-}
-'''
-
-
-def resolve_departure_airport_detail(
+async def resolve_departure_airport_detail(
     origin_kgmid: str,
     destination: str,
     departure_date: str,
@@ -926,69 +1231,77 @@ def resolve_departure_airport_detail(
     logger.debug(f"[api] Google Flights URL: {gf_url}")
 
     # Prepare the Browserless.io request
-    payload = {
-        "code": _BROWSERLESS_FUNCTION_CODE,
-        "context": {
-            "url": gf_url,
-            "timeout": timeout_ms,
-            "debug": debug,
-            "destination": destination
-        }
+    context = {
+        "url": gf_url,
+        "timeout": timeout_ms,
+        "debug": debug,
+        "destination": destination
     }
 
     browserless_url = f"{_BROWSERLESS_ENDPOINT}?token={_BROWSERLESS_API_KEY}"
 
-    last_error = None
-    attempts = 2
-    for attempt in range(1, attempts + 1):
+    # Serialize once; retries reuse the same body bytes over the pooled client
+    payload_bytes = b'{"code":' + _CODE_JSON_BYTES + b',"context":' + orjson.dumps(context) + b'}'
+
+    async def _attempt() -> dict:
+        """One Browserless render; never raises, returns a result or error dict."""
         try:
-            req = urllib.request.Request(
-                browserless_url,
-                data=json.dumps(payload).encode('utf-8'),
-                headers={
-                    'Content-Type': 'application/json'
-                },
-                method='POST'
+            response = await _http.post(
+                browserless_url, content=payload_bytes,
+                headers={"content-type": "application/json"},
             )
-
-            with urllib.request.urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-
-                if isinstance(result, dict):
-                    data = result.get("data") if "data" in result else result
-                    if isinstance(data, dict):
-                        if data.get("airport"):
-                            airport = data["airport"]
-                            source = data.get("source", "unknown")
-                            logger.info(f"[api] Resolved departure airport: {airport} (source: {source})")
-                            return data
-
-                        logger.warning(f"[api] Could not resolve departure airport: {data}")
-                        last_error = data
-                    else:
-                        last_error = {"airport": None, "error": "Unexpected data format from Browserless"}
-                else:
-                    last_error = {"airport": None, "error": "Unexpected response from Browserless"}
-
-        except urllib.error.HTTPError as e:
-            logger.error(f"[api] Browserless.io HTTP error: {e.code} {e.reason}")
+            response.raise_for_status()
+            result = response.json()
+
+            if isinstance(result, dict):
+                data = result.get("data") if "data" in result else result
+                if isinstance(data, dict):
+                    if data.get("airport"):
+                        airport = data["airport"]
+                        source = data.get("source", "unknown")
+                        logger.info(f"[api] Resolved departure airport: {airport} (source: {source})")
+                        return data
+
+                    logger.warning(f"[api] Could not resolve departure airport: {data}")
+                    return data
+                return {"airport": None, "error": "Unexpected data format from Browserless"}
+            return {"airport": None, "error": "Unexpected response from Browserless"}
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"[api] Browserless.io HTTP error: {e.response.status_code} {e.response.reason_phrase}")
             try:
-                error_body = e.read().decode('utf-8')
-                logger.error(f"[api] Error details: {error_body[:500]}")
+                logger.error(f"[api] Error details: {e.response.text[:500]}")
             except Exception:
                 pass
-            last_error = {"airport": None, "error": f"Browserless.io HTTP error: {e.code} {e.reason}"}
+            return {"airport": None, "error": f"Browserless.io HTTP error: {e.response.status_code} {e.response.reason_phrase}"}
         except Exception as e:
             logger.error(f"[api] Error calling Browserless.io: {e}")
-            last_error = {"airport": None, "error": f"Error calling Browserless.io: {e}"}
+            return {"airport": None, "error": f"Error calling Browserless.io: {e}"}
+
+    async def _hedged_attempt() -> dict:
+        await asyncio.sleep(1.5)
+        return await _attempt()
 
-        if attempt < attempts:
-            time.sleep(1.5)
+    # Hedge the render: launch a second attempt 1.5 s behind the first and
+    # take whichever resolves an airport first, cancelling the loser
+    pending = {asyncio.ensure_future(_attempt()), asyncio.ensure_future(_hedged_attempt())}
+    last_error = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                data = task.result()
+                if data.get("airport"):
+                    return data
+                last_error = data
+    finally:
+        for task in pending:
+            task.cancel()
 
     return last_error or {"airport": None, "error": "Unknown Browserless error"}
 
 
-def resolve_departure_airport(
+async def resolve_departure_airport(
     origin_kgmid: str,
     destination: str,
     departure_date: str,
@@ -996,14 +1309,14 @@ def resolve_departure_airport(
     timeout_ms: int = 20000
 ) -> Optional[str]:
     """Return only the resolved airport code or None."""
-    detail = resolve_departure_airport_detail(
+    detail = await resolve_departure_airport_detail(
         origin_kgmid, destination, departure_date, return_date, timeout_ms=timeout_ms
     )
     return detail.get("airport")
 
 
 @app.get("/resolve-departure", dependencies=[Depends(authenticated_endpoint)])
-def resolve_departure(
+async def resolve_departure(
     origin: str = Query(..., description="Origin kgmid (e.g., /m/05qhw for Poland)"),
     destination: str = Query(..., description="Destination IATA code (e.g., VLC)"),
     departure: str = Query(..., description="Departure date (YYYY-MM-DD)"),
@@ -1018,13 +1331,13 @@ def resolve_departure(
     # Validate origin is a kgmid
     if not origin.startswith('/'):
         # If it's already an IATA code, just return it
-        if re.match(r'^[A-Z]{3}$', origin.upper()):
+        if _is_iata(origin.upper()):
             return {"airport": origin.upper(), "source": "direct_iata"}
         raise HTTPException(status_code=422, detail="Origin must be a kgmid (e.g., /m/05qhw) or IATA code")
 
     # Validate destination
     destination = destination.upper()
-    if not re.match(r'^[A-Z]{3}$', destination):
+    if not _is_iata(destination):
         raise HTTPException(status_code=422, detail="Destination must be a 3-letter IATA code")
 
     # Validate dates
@@ -1038,7 +1351,7 @@ def resolve_departure(
         raise HTTPException(status_code=422, detail="Return date must be after departure date")
 
     # Call Browserless.io to resolve
-    detail = resolve_departure_airport_detail(
+    detail = await resolve_departure_airport_detail(
         origin, destination, departure, return_date, debug=debug
     )
 
@@ -1049,7 +1362,7 @@ def resolve_departure(
 
 
 @app.get("/google-flights-url", dependencies=[Depends(authenticated_endpoint)])
-def google_flights_url(
+async def google_flights_url(
     origin: str = Query(..., description="Origin kgmid or IATA code (e.g., /m/05qhw or WAW)"),
     destination: str = Query(..., description="Destination IATA code (e.g., VLC)"),
     departure: str = Query(..., description="Departure date (YYYY-MM-DD)"),
@@ -1063,7 +1376,7 @@ def google_flights_url(
     origin = _validate_origin(origin)
 
     destination = destination.upper()
-    if not _IATA_PATTERN.match(destination):
+    if not _is_iata(destination):
         raise HTTPException(status_code=422, detail="Destination must be a 3-letter IATA code")
 
     # Validate dates
@@ -1082,7 +1395,7 @@ def google_flights_url(
     origin_for_url = origin
 
     if resolve and origin.startswith('/'):
-        detail = resolve_departure_airport_detail(origin, destination, departure, return_date, debug=debug)
+        detail = await resolve_departure_airport_detail(origin, destination, departure, return_date, debug=debug)
         resolved_airport = detail.get("airport")
         debug_info = detail.get("debug")
         if resolved_airport:
@@ -0,0 +1,213 @@
+export default async function ({ page, context }) {
+    const { url, timeout = 25000, debug = false } = context;
+
+    try {
+        // Navigate to Google Flights
+        await page.goto(url, { waitUntil: 'networkidle2', timeout });
+
+        // Wait for dynamic content to load - flight prices take time
+        await new Promise(r => setTimeout(r, 5000));
+
+        // Try to bring "Top departing flights" into view to force render
+        await page.evaluate(() => {
+            const candidates = Array.from(document.querySelectorAll('div, span'));
+            const target = candidates.find(el => (el.textContent || '').includes('Top departing flights'));
+            if (target && target.scrollIntoView) {
+                target.scrollIntoView({ block: 'center' });
+            } else {
+                window.scrollTo(0, Math.floor(document.body.scrollHeight * 0.5));
+            }
+        });
+
+        await new Promise(r => setTimeout(r, 2000));
+
+        // Look for the "Fly from" / "cheaper from" notification or extract the displayed origin
+        const result = await page.evaluate((destination) => {
+            const bodyText = document.body.innerText;
+            const dest = (destination || '').toUpperCase();
+
+            const collectCandidateTexts = () => {
+                const nodes = [
+                    ...document.querySelectorAll('[role="status"], [role="alert"], [aria-live], [role="tooltip"], [aria-label], [title]')
+                ];
+                return nodes
+                    .map(el => el.getAttribute('aria-label') || el.getAttribute('title') || el.textContent || '')
+                    .filter(Boolean);
+            };
+
+            // Strategy 1: Look for "Fly from XXX for €YY" notification/banner
+            // This appears when Google suggests a cheaper departure airport
+            const notificationTextCandidates = collectCandidateTexts();
+            const notificationText = notificationTextCandidates.join(' ');
+
+            const flyFromPatterns = [
+                /Fly from\s+([A-Z]{3})\s+for\s+([€$£]?\s*\d+|\d+\s*[€$£])/i,
+                /\bfrom\s+([A-Z]{3})\s+for\s+([€$£]?\s*\d+|\d+\s*[€$£])/i,
+            ];
+
+            for (const pattern of flyFromPatterns) {
+                const match = notificationText.match(pattern) || bodyText.match(pattern);
+                if (match) {
+                    return { airport: match[1], source: 'fly_from_notification' };
+                }
+            }
+
+            // Strategy 1b: Look for explicit data-iata-code on "Change airport" CTA
+            const changeAirportIata = document.querySelector('[data-is-origin="true"][data-iata-code]') ||
+                document.querySelector('[data-iata-code]');
+            if (changeAirportIata) {
+                const iata = changeAirportIata.getAttribute('data-iata-code');
+                if (iata && /^[A-Z]{3}$/.test(iata)) {
+                    return { airport: iata, source: 'change_airport_data' };
+                }
+            }
+
+            // Strategy 2: Look for "cheaper from XXX" notification/banner
+            const cheaperPatterns = [
+                /(?:from|From)\s+([A-Z]{3})\s+(?:is|are|would be)\s+cheaper/i,
+                /[Ff]lights?\s+from\s+([A-Z]{3})\s+are\s+[€$£]?\d+\s+cheaper/i,
+                /[Cc]heaper\s+from\s+([A-Z]{3})/i,
+                /[Ss]ave\s+[€$£]?\d+.*?from\s+([A-Z]{3})/i
+            ];
+
+            for (const pattern of cheaperPatterns) {
+                const match = bodyText.match(pattern);
+                if (match) {
+                    return { airport: match[1], source: 'cheaper_suggestion' };
+                }
+            }
+
+            // Strategy 3: Look for the origin airport in the search form
+            // The input field shows the currently selected origin
+            const originInputs = document.querySelectorAll('input[placeholder*="Where from"], input[aria-label*="Where from"], input[aria-label*="origin" i], input[aria-label*="departure" i]');
+            for (const input of originInputs) {
+                const text = input.value || input.textContent || '';
+                const iataMatch = text.match(/\b([A-Z]{3})\b/);
+                if (iataMatch) {
+                    return { airport: iataMatch[1], source: 'origin_input' };
+                }
+            }
+
+            // Strategy 4: Look for departure airport in displayed flight cards
+            // Flight cards show "WAW – VLC" or "WAW-VLC" format
+            const flightRoutePattern = /\b([A-Z]{3})\s*[–—-]\s*([A-Z]{3})\b/;
+            const candidateTexts = collectCandidateTexts().concat([bodyText]);
+            const routeCandidates = [];
+            for (const text of candidateTexts) {
+                const match = text.match(flightRoutePattern);
+                if (match) {
+                    routeCandidates.push(match);
+                }
+            }
+            if (routeCandidates.length > 0) {
+                return { airport: routeCandidates[0][1], source: 'flight_route' };
+            }
+
+            // Strategy 5: Look near "Change airport" tooltip text
+            const changeAirportNodes = Array.from(document.querySelectorAll('*'))
+                .filter(el => (el.textContent || '').includes('Change airport'))
+                .slice(0, 5);
+
+            for (const node of changeAirportNodes) {
+                const text = node.textContent || '';
+                const match = text.match(/\bfrom\s+([A-Z]{3})\b/i);
+                if (match) {
+                    return { airport: match[1], source: 'change_airport_tooltip' };
+                }
+            }
+
+            // Strategy 6: Scan script payloads for origin/destination pairs
+            if (dest) {
+                const scriptTexts = Array.from(document.querySelectorAll('script'))
+                    .map(script => script.textContent || '')
+                    .filter(Boolean);
+                // Doubled backslashes are deliberate: the RegExp source must
+                // contain \b word boundaries, and a single \b inside a template
+                // literal is a backspace escape (which this pattern once shipped)
+                const pairPattern = new RegExp(`\\b([A-Z]{3})\\b[^A-Z]{0,40}\\b${dest}\\b`);
+                for (const text of scriptTexts) {
+                    const match = text.match(pairPattern);
+                    if (match) {
+                        return { airport: match[1], source: 'script_pair' };
+                    }
+                }
+            }
+
+            return null;
+        }, context.destination);
+
+        if (!result && debug) {
+            const debugInfo = await page.evaluate(() => {
+                const limitText = (text, max = 2000) => {
+                    if (!text) return text;
+                    return text.length > max ? text.slice(0, max) + '…' : text;
+                };
+
+                const candidates = Array.from(
+                    document.querySelectorAll('[role="status"], [role="alert"], [aria-live], [role="tooltip"], [aria-label], [title]')
+                )
+                    .map(el => el.getAttribute('aria-label') || el.getAttribute('title') || el.textContent || '')
+                    .filter(Boolean);
+
+                const interesting = candidates.filter(text =>
+                    /(Fly from|cheaper from|from\s+[A-Z]{3}|Change airport)/i.test(text)
+                );
+
+                const dataIataElements = Array.from(document.querySelectorAll('[data-iata-code]'))
+                    .map(el => ({
+                        iata: el.getAttribute('data-iata-code'),
+                        is_origin: el.getAttribute('data-is-origin'),
+                        text: (el.textContent || '').trim()
+                    }))
+                    .slice(0, 10);
+
+                const originInputs = Array.from(
+                    document.querySelectorAll('input[placeholder*="Where from"], input[aria-label*="Where from"], input[aria-label*="origin" i], input[aria-label*="departure" i]')
+                )
+                    .map(input => input.value || input.textContent || '')
+                    .filter(Boolean);
+
+                const bodyText = document.body.innerText || '';
+                const routeMatches = [...bodyText.matchAll(/\b([A-Z]{3})\s*[–—-]\s*[A-Z]{3}\b/g)]
+                    .slice(0, 3)
+                    .map(match => match[0]);
+
+                const changeAirportNode = Array.from(document.querySelectorAll('*'))
+                    .find(el => (el.textContent || '').includes('Change airport'));
+
+                const topDepartingNode = Array.from(document.querySelectorAll('*'))
+                    .find(el => (el.textContent || '').includes('Top departing flights'));
+
+                return {
+                    candidate_snippets: interesting.slice(0, 8),
+                    data_iata_elements: dataIataElements,
+                    origin_inputs: originInputs.slice(0, 5),
+                    route_matches: routeMatches,
+                    change_airport_html: changeAirportNode ? limitText(changeAirportNode.outerHTML) : null,
+                    top_departing_html: topDepartingNode ? limitText(topDepartingNode.outerHTML) : null,
+                };
+            });
+
+            return {
+                data: { airport: null, error: 'No airport match found', debug: debugInfo },
+                type: 'application/json'
+            };
+        }
+
+        if (result) {
+            return { data: result, type: 'application/json' };
+        }
+
+        // No airport found
+        return {
+            data: { airport: null, error: 'Could not find departure airport in page' },
+            type: 'application/json'
+        };
+
+    } catch (error) {
+        return {
+            data: { airport: null, error: error.message },
+            type: 'application/json'
+        };
+    }
+}
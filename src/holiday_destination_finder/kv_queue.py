@@ -1,6 +1,8 @@
-import os, json, time, uuid, logging
+import json, time, uuid, hashlib, logging, queue, threading
 import redis
 
+from ._redis import r
+
 logger = logging.getLogger(__name__)
 
 # Import Supabase functions (optional - will fail gracefully if not configured)
@@ -10,7 +12,43 @@ except ImportError:
     save_search_result = None
     logger.warning("[kv_queue] Supabase module not available")
 
-r = redis.Redis.from_url(os.environ["REDIS_URL"], decode_responses=True)
+# Supabase dual-writes ride a background thread so a slow HTTP round-trip to
+# Supabase never sits on the worker's critical path between jobs
+_SUPA_QUEUE: "queue.Queue[tuple]" = queue.Queue(maxsize=1000)
+_supa_thread_started = False
+_supa_thread_lock = threading.Lock()
+
+
+def _supabase_writer():
+    while True:
+        job_id, client_id, params, payload, status = _SUPA_QUEUE.get()
+        try:
+            save_search_result(job_id, client_id, params, payload, status)
+        except Exception as e:
+            # Log but don't fail - Redis write succeeded
+            logger.error(f"[kv_queue] Failed to write to Supabase for job {job_id}: {e}")
+        finally:
+            _SUPA_QUEUE.task_done()
+
+
+def _enqueue_supabase_write(job_id, client_id, params, payload, status):
+    global _supa_thread_started
+    if not _supa_thread_started:
+        with _supa_thread_lock:
+            if not _supa_thread_started:
+                threading.Thread(
+                    target=_supabase_writer, daemon=True, name="supabase-writer"
+                ).start()
+                _supa_thread_started = True
+    try:
+        _SUPA_QUEUE.put_nowait((job_id, client_id, params, payload, status))
+    except queue.Full:
+        # Backlogged - do this one synchronously rather than dropping it
+        logger.warning(f"[kv_queue] Supabase write queue full, writing job {job_id} inline")
+        try:
+            save_search_result(job_id, client_id, params, payload, status)
+        except Exception as e:
+            logger.error(f"[kv_queue] Failed to write to Supabase for job {job_id}: {e}")
 
 QUEUE = "queue:jobs"
 JOB_TTL_S = 60 * 60  # 1 hour
@@ -26,24 +64,71 @@ def enqueue(params: dict, client_id: str | None = None) -> str:
     # Store client_id if provided (for Supabase persistence)
     if client_id:
         mapping["client_id"] = client_id
-    r.hset(key, mapping=mapping)
-    r.expire(key, JOB_TTL_S)
-    r.rpush(QUEUE, job_id)
+    # One pipelined round-trip instead of three
+    pipe = r.pipeline(transaction=False)
+    pipe.hset(key, mapping=mapping)
+    pipe.expire(key, JOB_TTL_S)
+    pipe.rpush(QUEUE, job_id)
+    pipe.execute()
     return job_id
 
+def dequeue(timeout: int = 30) -> str | None:
+    """
+    Block until a job is available (or timeout expires) and return its id.
+    BLPOP sleeps in the kernel and wakes immediately on enqueue, so consumers
+    burn no CPU polling. Returns None on timeout.
+    """
+    try:
+        item = r.blpop(QUEUE, timeout=timeout)
+    except (redis.exceptions.TimeoutError, redis.exceptions.ConnectionError) as e:
+        # Treat a dropped/timed-out connection like an empty poll; the worker
+        # loop just calls dequeue again rather than dying on a blip
+        logger.warning(f"[kv_queue] BLPOP interrupted, retrying: {e}")
+        return None
+    return item[1] if item else None
+
 def get_job(job_id: str) -> dict | None:
     data = r.hgetall(f"job:{job_id}")
     return data or None
 
+def get_job_with_queue_position(job_id: str) -> tuple[dict | None, int | None]:
+    """
+    Fetch the job hash and its queue position in a single pipelined round-trip.
+    Returns (data, position) where position is 1-based or None if not queued.
+    """
+    try:
+        pipe = r.pipeline(transaction=False)
+        pipe.hgetall(f"job:{job_id}")
+        # LPOS scans server-side instead of shipping the whole queue list back
+        pipe.lpos(QUEUE, job_id)
+        data, pos = pipe.execute()
+    except Exception as e:
+        logger.error(f"[kv_queue] Error fetching job with queue position: {e}")
+        return get_job(job_id), None
+
+    # LPOS returns None when the job is not queued (might have been popped)
+    position = pos + 1 if pos is not None else None  # Convert 0-based to 1-based
+    return (data or None), position
+
 def set_running(job_id: str):
-    r.hset(f"job:{job_id}", "status", "running")
-    r.expire(f"job:{job_id}", JOB_TTL_S)
+    pipe = r.pipeline(transaction=False)
+    pipe.hset(f"job:{job_id}", "status", "running")
+    pipe.expire(f"job:{job_id}", JOB_TTL_S)
+    pipe.execute()
 
 def set_done(job_id: str, payload: dict):
     key = f"job:{job_id}"
-    r.hset(key, mapping={"status": "done", "result": json.dumps(payload)})
-    r.hdel(key, "processed", "total", "current")
-    r.expire(key, JOB_TTL_S)
+    # Serialize once at write time; the API serves these bytes as-is and uses
+    # the etag for If-None-Match polling without rehashing per poll. The tag
+    # is stored DQUOTE-wrapped, the entity-tag form RFC 9110 requires on the
+    # wire, so stored value, ETag header, and If-None-Match all match as-is.
+    result_json = json.dumps(payload)
+    etag = '"{}"'.format(hashlib.blake2b(result_json.encode(), digest_size=8).hexdigest())
+    pipe = r.pipeline(transaction=False)
+    pipe.hset(key, mapping={"status": "done", "result": result_json, "etag": etag})
+    pipe.hdel(key, "processed", "total", "current")
+    pipe.expire(key, JOB_TTL_S)
+    pipe.execute()
     
     # Check if results are empty - don't save empty searches to Supabase
     results = payload.get("results", [])
@@ -62,7 +147,8 @@ def set_done(job_id: str, payload: dict):
                 if client_id and params_str:
                     try:
                         params = json.loads(params_str) if isinstance(params_str, str) else params_str
-                        save_search_result(job_id, client_id, params, payload, "done")
+                        # Deferred to the writer thread - doesn't block the worker
+                        _enqueue_supabase_write(job_id, client_id, params, payload, "done")
                     except Exception as e:
                         # Log but don't fail - Redis write succeeded
                         logger.error(f"[kv_queue] Failed to write to Supabase for job {job_id}: {e}")
@@ -71,9 +157,11 @@ def set_done(job_id: str, payload: dict):
 
 def set_failed(job_id: str, error: str):
     key = f"job:{job_id}"
-    r.hset(key, mapping={"status": "failed", "error": error})
-    r.hdel(key, "processed", "total", "current")
-    r.expire(key, JOB_TTL_S)
+    pipe = r.pipeline(transaction=False)
+    pipe.hset(key, mapping={"status": "failed", "error": error})
+    pipe.hdel(key, "processed", "total", "current")
+    pipe.expire(key, JOB_TTL_S)
+    pipe.execute()
     
     # Do NOT save failed queries to Supabase - they shouldn't appear in user history
     # Failed queries remain in Redis for short-term error display but are not persisted
@@ -99,48 +187,45 @@ def set_progress(
         mapping["origin_airport"] = origin_airport
         mapping["origin_airport_idx"] = str(origin_airport_idx)
         mapping["origin_airport_total"] = str(origin_airport_total)
-    r.hset(f"job:{job_id}", mapping=mapping)
-    r.expire(f"job:{job_id}", JOB_TTL_S)
+    # set_progress fires once per destination - keep it to a single round-trip
+    pipe = r.pipeline(transaction=False)
+    pipe.hset(f"job:{job_id}", mapping=mapping)
+    pipe.expire(f"job:{job_id}", JOB_TTL_S)
+    pipe.execute()
 
 def get_queue_position(job_id: str) -> int | None:
     """Get the position of a job in the queue. Returns None if job is not in queue."""
     try:
-        # Get all job IDs in the queue
-        queue_items = r.lrange(QUEUE, 0, -1)
-        if not queue_items:
-            return None
-        
-        # Find the position of this job_id (1-based)
-        try:
-            position = queue_items.index(job_id)
-            return position + 1  # Convert 0-based to 1-based
-        except ValueError:
-            # Job not in queue (might have been popped already)
-            return None
+        # LPOS finds the index server-side instead of transferring the whole
+        # queue list per poll; returns None if the job was already popped
+        pos = r.lpos(QUEUE, job_id)
+        return pos + 1 if pos is not None else None  # Convert 0-based to 1-based
     except Exception as e:
         # Log error for debugging but don't break the API
         logger.error(f"[kv_queue] Error getting queue position: {e}")
         return None
 
+# Atomic cancel: remove from queue, check status, and mark cancelled in one
+# server-side step, so a worker can't pop the job between the LREM and HSET
+_CANCEL_LUA = """
+redis.call('LREM', KEYS[2], 0, ARGV[1])
+if redis.call('EXISTS', KEYS[1]) == 0 then return 0 end
+local status = redis.call('HGET', KEYS[1], 'status')
+if status == 'queued' or status == 'running' then
+    redis.call('HSET', KEYS[1], 'status', 'cancelled')
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+    return 1
+end
+return 0
+"""
+_cancel_script = r.register_script(_CANCEL_LUA)
+
+
 def cancel_job(job_id: str) -> bool:
     """Cancel a job by removing it from queue and marking it as cancelled. Returns True if cancelled."""
     try:
-        # Remove from queue if present
-        r.lrem(QUEUE, 0, job_id)
-        
-        # Check if job exists
-        job_key = f"job:{job_id}"
-        if not r.exists(job_key):
-            return False
-        
-        # Mark as cancelled (unless already done/failed)
-        status = r.hget(job_key, "status")
-        if status in ("queued", "running"):
-            r.hset(job_key, mapping={"status": "cancelled"})
-            r.expire(job_key, JOB_TTL_S)
-            return True
-        
-        return False
+        # register_script handles EVALSHA caching and NOSCRIPT re-upload
+        return bool(_cancel_script(keys=[f"job:{job_id}", QUEUE], args=[job_id, JOB_TTL_S]))
     except Exception as e:
         logger.error(f"[kv_queue] Error cancelling job {job_id}: {e}")
         return False
\ No newline at end of file
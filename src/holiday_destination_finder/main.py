@@ -1,12 +1,13 @@
 from holiday_destination_finder.providers.openmeteo import get_weather_data
 from holiday_destination_finder.providers.amadeus import get_best_offer_in_window, amadeus_call_stats, amadeus_429_err_count
-from holiday_destination_finder.scoring import total_score
+from holiday_destination_finder.scoring import total_score, total_score_batch
 from holiday_destination_finder.providers.ryanair_test import find_cheapest_offer, get_cheapest_ryanair_offer_for_dates
 from holiday_destination_finder.providers.wizzair_test import find_cheapest_trip
 from holiday_destination_finder.providers.serpapi_test import discover_destinations, serpapi_call_stats, SerpApiBeyondRangeError
 from holiday_destination_finder.airports import expand_origin_to_airports, get_origin_display_name
 from pathlib import Path
-import csv, argparse, datetime, threading, time, os, requests, logging, re
+import argparse, datetime, heapq, math, sys, threading, time, os, requests, logging, re
+import pandas as pd
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Callable
 
@@ -39,7 +40,12 @@ def validate_date(date_str: str) -> str:
     """Validate date format (YYYY-MM-DD)."""
     date_str = date_str.strip()
     try:
-        datetime.datetime.strptime(date_str, "%Y-%m-%d")
+        # fromisoformat is a C fast path vs strptime recompiling the format
+        # per call; the shape check keeps the strict YYYY-MM-DD contract,
+        # since 3.11+ fromisoformat also accepts compact forms like YYYYMMDD
+        if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+            raise ValueError
+        datetime.date.fromisoformat(date_str)
         return date_str
     except ValueError:
         raise ValidationError(
@@ -58,8 +64,8 @@ def validate_trip_length(trip_length: int) -> int:
 
 def validate_date_range(start: str, end: str, trip_length: int) -> None:
     """Validate that date range is compatible with trip length."""
-    start_dt = datetime.datetime.strptime(start, "%Y-%m-%d").date()
-    end_dt = datetime.datetime.strptime(end, "%Y-%m-%d").date()
+    start_dt = datetime.date.fromisoformat(start)
+    end_dt = datetime.date.fromisoformat(end)
 
     if end_dt < start_dt:
         raise ValidationError(
@@ -128,6 +134,40 @@ def prompt_int_with_validation(prompt: str, validator):
 def _to_iso(x):
     return x.isoformat() if hasattr(x, "isoformat") else str(x)
 
+def _load_destinations(cities_csv: Path) -> list[dict]:
+    """
+    Load the cities CSV with pandas so parsing and the lat/lon float
+    conversions run in C, then hand back the dict-per-row shape the
+    destination processing expects.
+    """
+    df = pd.read_csv(cities_csv, dtype={"lat": float, "lon": float})
+    return df.to_dict("records")
+
+def _price_range(results: list[dict]) -> tuple[float, float]:
+    """
+    Global price range over results in a single pass (instead of a filter
+    comprehension plus separate min() and max() sweeps). Returns
+    (inf, -inf) when no result carries a price.
+    """
+    lo, hi = math.inf, -math.inf
+    for r in results:
+        p = r.get("flight_price")
+        if p is None:
+            continue
+        if p < lo:
+            lo = p
+        if p > hi:
+            hi = p
+    return lo, hi
+
+def _grid_coords(lat: float, lon: float) -> tuple[float, float]:
+    """
+    Snap coordinates to a 0.25-degree grid (~25 km, OpenMeteo's native
+    resolution). Nearby cities land in the same cell and share one weather
+    lookup instead of each missing the cache on unique float coordinates.
+    """
+    return round(lat * 4) / 4, round(lon * 4) / 4
+
 def _normalize_providers(providers):
     if isinstance(providers, str):
         return [x.strip().lower() for x in providers.split(",") if x.strip()]
@@ -175,22 +215,44 @@ def main(origin, start, end, trip_length, providers, top_n: int = 10):
     validate_date_range(start, end, trip_length)
 
     if not os.getenv("USER_LOCAL_CURRENCY") and not os.getenv("FLI_SOURCE_CCY"):
+        # The detected currency barely ever changes, so a 7-day file cache
+        # keeps the synchronous IPAPI round-trip off the startup path
+        cache_file = os.path.join(
+            os.path.expanduser("~"), ".cache", "holiday-destination-finder", "currency"
+        )
         try:
-            r = requests.get("https://ipapi.co/currency/", timeout=5)
+            if time.time() - os.path.getmtime(cache_file) < 7 * 86400:
+                with open(cache_file) as fh:
+                    cached = fh.read().strip().upper()
+                if len(cached) == 3:
+                    logger.info(f"[main] Using cached local currency: {cached}")
+                    os.environ["USER_LOCAL_CURRENCY"] = cached
+        except OSError:
+            pass
 
-            if r.status_code == 200 and r.ok:
-                cc = r.text.strip().upper()
-                if len(cc) == 3:
-                    logger.info(f"[main] Detected local currency via IPAPI: {cc}")
-                    os.environ["USER_LOCAL_CURRENCY"] = cc
+        if not os.getenv("USER_LOCAL_CURRENCY"):
+            try:
+                r = requests.get("https://ipapi.co/currency/", timeout=2)
+
+                if r.status_code == 200 and r.ok:
+                    cc = r.text.strip().upper()
+                    if len(cc) == 3:
+                        logger.info(f"[main] Detected local currency via IPAPI: {cc}")
+                        os.environ["USER_LOCAL_CURRENCY"] = cc
+                        try:
+                            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+                            with open(cache_file, "w") as fh:
+                                fh.write(cc)
+                        except OSError:
+                            pass
+                    else:
+                        logger.warning(f"[main] IPAPI returned malformed currency '{r.text}', falling back")
                 else:
-                    logger.warning(f"[main] IPAPI returned malformed currency '{r.text}', falling back")
-            else:
-                body = r.text.strip()[:100] if r.text else "NO_BODY"
-                logger.warning(f"[main] IPAPI returned HTTP {r.status_code} — body: '{body}'")
+                    body = r.text.strip()[:100] if r.text else "NO_BODY"
+                    logger.warning(f"[main] IPAPI returned HTTP {r.status_code} — body: '{body}'")
 
-        except Exception as e:
-            logger.warning(f"[main] Exception during IPAPI lookup: {e}")
+            except Exception as e:
+                logger.warning(f"[main] Exception during IPAPI lookup: {e}")
 
         # If still no currency -> fallback
         if not os.getenv("USER_LOCAL_CURRENCY"):
@@ -254,7 +316,8 @@ def _process_single_destination(
     weather_cache: dict,
     weather_cache_lock: threading.Lock,
     verbose: bool,
-    progress_cb
+    progress_cb,
+    provider_pool: ThreadPoolExecutor
 ) -> Optional[dict]:
     """Process a single destination and return result dict or None."""
     city = row['city']
@@ -280,7 +343,7 @@ def _process_single_destination(
 
     def fetch_amadeus():
         try:
-            return get_best_offer_in_window(origin, airport, start, end, trip_length, sleep_s=0.2)
+            return get_best_offer_in_window(origin, airport, start, end, trip_length)
         except Exception as e:
             if verbose:
                 logger.warning(f"[amadeus] failed for {city} ({airport}): {e}")
@@ -304,51 +367,68 @@ def _process_single_destination(
                 logger.warning(f"[wizzair] failed for {city} ({airport}): {e}")
             return []
 
-    # Run providers in parallel
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {}
-        if "amadeus" in providers:
-            futures["amadeus"] = executor.submit(fetch_amadeus)
-        if "ryanair" in providers:
-            futures["ryanair"] = executor.submit(fetch_ryanair)
-        if "wizzair" in providers:
-            futures["wizzair"] = executor.submit(fetch_wizzair)
-        
-        for provider, future in futures.items():
-            try:
-                result = future.result()
-                if provider == "amadeus":
-                    offers_a = result or []
-                elif provider == "ryanair":
-                    offers_r = result or []
-                elif provider == "wizzair":
-                    offers_w = result or []
-            except Exception as e:
-                if verbose:
-                    logger.warning(f"[{provider}] exception for {city} ({airport}): {e}")
+    # Run providers in parallel on the shared pool - spinning up a fresh
+    # executor here would spawn and join three threads per destination
+    futures = {}
+    if "amadeus" in providers:
+        futures["amadeus"] = provider_pool.submit(fetch_amadeus)
+    if "ryanair" in providers:
+        futures["ryanair"] = provider_pool.submit(fetch_ryanair)
+    if "wizzair" in providers:
+        futures["wizzair"] = provider_pool.submit(fetch_wizzair)
+
+    for provider, future in futures.items():
+        try:
+            result = future.result()
+            if provider == "amadeus":
+                offers_a = result or []
+            elif provider == "ryanair":
+                offers_r = result or []
+            elif provider == "wizzair":
+                offers_w = result or []
+        except Exception as e:
+            if verbose:
+                logger.warning(f"[{provider}] exception for {city} ({airport}): {e}")
 
     candidates = [trip for trip in (offers_a + offers_r + offers_w) if trip is not None]
     if not candidates:
         return None
 
-    price_list = [float(tup[0]) for tup in candidates]
-    loc_min_price = min(price_list)
-    loc_max_price = max(price_list)
+    # Single pass for the local price range instead of a list plus two sweeps
+    loc_min_price = loc_max_price = float(candidates[0][0])
+    for tup in candidates[1:]:
+        p = float(tup[0])
+        if p < loc_min_price:
+            loc_min_price = p
+        elif p > loc_max_price:
+            loc_max_price = p
 
     best_tup = None
     best_score = None
     best_weather = None
 
+    grid_lat, grid_lon = _grid_coords(lat_f, lon_f)
+
+    # Candidates from one city repeat the same handful of date objects, so
+    # convert each distinct one once instead of per candidate
+    iso_cache: dict = {}
+
+    def _iso(x):
+        s = iso_cache.get(x)
+        if s is None:
+            s = iso_cache[x] = _to_iso(x)
+        return s
+
     for price, curr, stops, airline, dep, ret in candidates:
-        dep_s = _to_iso(dep)
-        ret_s = _to_iso(ret)
-        cache_key = (lat_f, lon_f, dep_s, ret_s)
-        
+        dep_s = _iso(dep)
+        ret_s = _iso(ret)
+        cache_key = (grid_lat, grid_lon, dep_s, ret_s)
+
         # Thread-safe weather cache access
         with weather_cache_lock:
             if cache_key not in weather_cache:
                 try:
-                    weather_data = get_weather_data(lat_f, lon_f, dep_s, ret_s)
+                    weather_data = get_weather_data(grid_lat, grid_lon, dep_s, ret_s)
                     weather_cache[cache_key] = weather_data
                 except Exception as e:
                     if verbose:
@@ -376,8 +456,8 @@ def _process_single_destination(
             "currency": currency,
             "total_stops": total_stops,
             "airlines": airlines,
-            "best_departure": _to_iso(best_dep),
-            "best_return": _to_iso(best_ret),
+            "best_departure": _iso(best_dep),
+            "best_return": _iso(best_ret),
             "weather_data": best_weather,
         }
         
@@ -445,10 +525,7 @@ def _search_with_fallback_providers(
         max_workers = 10
 
     # Read all destinations
-    destinations = []
-    with open(CITIES_CSV, newline="", encoding="utf-8") as cities_csv:
-        reader = csv.DictReader(cities_csv)
-        destinations = list(reader)
+    destinations = _load_destinations(CITIES_CSV)
 
     total = len(destinations)
     logger.info(f"[fallback] Processing {total} destinations with {max_workers} parallel workers")
@@ -458,14 +535,16 @@ def _search_with_fallback_providers(
     weather_cache_lock = threading.Lock()
     processed_lock = threading.Lock()
 
-    # Process destinations in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Process destinations in parallel; one shared provider pool serves every
+    # city so threads are spawned once per search, not once per destination
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+         ThreadPoolExecutor(max_workers=max_workers * 3, thread_name_prefix="provider") as provider_pool:
         futures = {}
         for idx, row in enumerate(destinations, start=1):
             future = executor.submit(
                 _process_single_destination,
                 row, idx, total, single_origin, start, end, trip_length, providers,
-                weather_cache, weather_cache_lock, verbose, progress_cb
+                weather_cache, weather_cache_lock, verbose, progress_cb, provider_pool
             )
             futures[future] = idx
 
@@ -480,27 +559,25 @@ def _search_with_fallback_providers(
                 if verbose:
                     logger.error(f"[fallback] Failed to process destination {idx}: {e}")
 
-    prices = [r["flight_price"] for r in results if r.get("flight_price") is not None]
-    if not prices:
+    min_price, max_price = _price_range(results)
+    if math.isinf(min_price):
         logger.info("[fallback] No results found from Ryanair+Wizzair")
         return []
 
-    min_price = min(prices)
-    max_price = max(prices)
-
-    for r in results:
-        r["score"] = total_score(
-            r["weather_data"],
-            r["flight_price"],
-            r["total_stops"],
-            min_price,
-            max_price,
-        )
+    scores = total_score_batch(
+        [r["weather_data"] for r in results],
+        [r["flight_price"] for r in results],
+        [r["total_stops"] for r in results],
+        min_price,
+        max_price,
+    )
+    for r, s in zip(results, scores):
+        r["score"] = float(s)
         r.pop("weather_data", None)
 
-    results.sort(key=lambda x: float(x.get('score', 0)), reverse=True)
     logger.info(f"[fallback] Returning {len(results)} scored destinations from extended search")
-    return results[:top_n]
+    # Top-N selection beats a full sort: O(N log top_n) for the 10 we keep
+    return heapq.nlargest(top_n, results, key=lambda x: float(x.get('score', 0)))
 
 
 def _search_with_serpapi(
@@ -571,15 +648,17 @@ def _search_with_serpapi(
         best_flight = None
         best_weather = None
 
+        grid_lat, grid_lon = _grid_coords(float(lat), float(lon))
+
         for flight in flights:
             dep_date = flight["dep_date"]
             ret_date = flight["ret_date"]
-            cache_key = (lat, lon, dep_date, ret_date)
+            cache_key = (grid_lat, grid_lon, dep_date, ret_date)
 
             # Get weather data (with caching)
             if cache_key not in weather_cache:
                 try:
-                    weather_data = get_weather_data(lat, lon, dep_date, ret_date)
+                    weather_data = get_weather_data(grid_lat, grid_lon, dep_date, ret_date)
                     weather_cache[cache_key] = weather_data
                 except Exception as e:
                     if verbose:
@@ -627,23 +706,21 @@ def _search_with_serpapi(
         return []
 
     # Final scoring with global price range
-    prices = [r["flight_price"] for r in results]
-    min_price = min(prices)
-    max_price = max(prices)
-
-    for r in results:
-        r["score"] = total_score(
-            r["weather_data"],
-            r["flight_price"],
-            r["total_stops"],
-            min_price,
-            max_price,
-        )
+    min_price, max_price = _price_range(results)
+
+    scores = total_score_batch(
+        [r["weather_data"] for r in results],
+        [r["flight_price"] for r in results],
+        [r["total_stops"] for r in results],
+        min_price,
+        max_price,
+    )
+    for r, s in zip(results, scores):
+        r["score"] = float(s)
         r.pop("weather_data", None)
 
-    results.sort(key=lambda x: float(x.get('score', 0)), reverse=True)
     logger.info(f"[serpapi] Returning {len(results)} scored destinations")
-    return results[:top_n]
+    return heapq.nlargest(top_n, results, key=lambda x: float(x.get('score', 0)))
 
 
 def _search_multi_airport(
@@ -670,10 +747,7 @@ def _search_multi_airport(
         max_workers = max_workers or 10
 
     # Read all destinations
-    destinations = []
-    with open(CITIES_CSV, newline="", encoding="utf-8") as cities_csv:
-        reader = csv.DictReader(cities_csv)
-        destinations = list(reader)
+    destinations = _load_destinations(CITIES_CSV)
 
     total_destinations = len(destinations)
     total_airports = len(origin_airports)
@@ -709,14 +783,16 @@ def _search_multi_airport(
 
         airport_progress_cb = make_progress_cb(origin_airport, airport_idx, total_airports)
 
-        # Process destinations for this origin airport
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Process destinations for this origin airport; the provider pool is
+        # shared by every city in the pass instead of respawned per destination
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+             ThreadPoolExecutor(max_workers=max_workers * 3, thread_name_prefix="provider") as provider_pool:
             futures = {}
             for idx, row in enumerate(destinations, start=1):
                 future = executor.submit(
                     _process_single_destination,
                     row, idx, total_destinations, origin_airport, start, end, trip_length, providers,
-                    weather_cache, weather_cache_lock, verbose, airport_progress_cb
+                    weather_cache, weather_cache_lock, verbose, airport_progress_cb, provider_pool
                 )
                 futures[future] = (idx, row)
 
@@ -742,25 +818,22 @@ def _search_multi_airport(
         return []
 
     # Final scoring with global price range
-    prices = [r["flight_price"] for r in results if r.get("flight_price") is not None]
-    if not prices:
+    min_price, max_price = _price_range(results)
+    if math.isinf(min_price):
         return []
 
-    min_price = min(prices)
-    max_price = max(prices)
-
-    for r in results:
-        r["score"] = total_score(
-            r["weather_data"],
-            r["flight_price"],
-            r["total_stops"],
-            min_price,
-            max_price,
-        )
+    scores = total_score_batch(
+        [r["weather_data"] for r in results],
+        [r["flight_price"] for r in results],
+        [r["total_stops"] for r in results],
+        min_price,
+        max_price,
+    )
+    for r, s in zip(results, scores):
+        r["score"] = float(s)
         r.pop("weather_data", None)
 
-    results.sort(key=lambda x: float(x.get('score', 0)), reverse=True)
-    return results[:top_n]
+    return heapq.nlargest(top_n, results, key=lambda x: float(x.get('score', 0)))
 
 
 def search_destinations(
@@ -813,10 +886,7 @@ def search_destinations(
         max_workers = max_workers or 10
 
     # Read all destinations first
-    destinations = []
-    with open(CITIES_CSV, newline="", encoding="utf-8") as cities_csv:
-        reader = csv.DictReader(cities_csv)
-        destinations = list(reader)
+    destinations = _load_destinations(CITIES_CSV)
 
     total = len(destinations)
     logger.info(f"[main] Processing {total} destinations with {max_workers} parallel workers")
@@ -827,14 +897,16 @@ def search_destinations(
     processed_count = 0
     processed_lock = threading.Lock()
 
-    # Process destinations in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # Process destinations in parallel; one shared provider pool serves every
+    # city so threads are spawned once per search, not once per destination
+    with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+         ThreadPoolExecutor(max_workers=max_workers * 3, thread_name_prefix="provider") as provider_pool:
         futures = {}
         for idx, row in enumerate(destinations, start=1):
             future = executor.submit(
                 _process_single_destination,
                 row, idx, total, single_origin, start, end, trip_length, providers,
-                weather_cache, weather_cache_lock, verbose, progress_cb
+                weather_cache, weather_cache_lock, verbose, progress_cb, provider_pool
             )
             futures[future] = idx
 
@@ -850,25 +922,22 @@ def search_destinations(
                 if verbose:
                     logger.error(f"[ERROR] Failed to process destination {idx}: {e}")
 
-    prices = [r["flight_price"] for r in results if r.get("flight_price") is not None]
-    if not prices:
+    min_price, max_price = _price_range(results)
+    if math.isinf(min_price):
         return []
 
-    min_price = min(prices)
-    max_price = max(prices)
-
-    for r in results:
-        r["score"] = total_score(
-            r["weather_data"],
-            r["flight_price"],
-            r["total_stops"],
-            min_price,
-            max_price,
-        )
+    scores = total_score_batch(
+        [r["weather_data"] for r in results],
+        [r["flight_price"] for r in results],
+        [r["total_stops"] for r in results],
+        min_price,
+        max_price,
+    )
+    for r, s in zip(results, scores):
+        r["score"] = float(s)
         r.pop("weather_data", None)
 
-    results.sort(key=lambda x: float(x.get('score', 0)), reverse=True)
-    return results[:top_n]
+    return heapq.nlargest(top_n, results, key=lambda x: float(x.get('score', 0)))
 
 
 
@@ -926,8 +995,14 @@ def start_elapsed_timer(stop_event: threading.Event):
     start_time = time.time()
     while not stop_event.is_set():
         elapsed = int(time.time() - start_time)
-        print(f"[running] {elapsed // 60}m{elapsed % 60}s elapsed")
-        time.sleep(1)
+        # Rewrite a single status line every 5s instead of printing a fresh
+        # line per second - fewer stdout flushes and less GIL contention
+        # with the destination worker threads
+        sys.stdout.write(f"\r[running] {elapsed // 60}m{elapsed % 60}s elapsed")
+        sys.stdout.flush()
+        stop_event.wait(5)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     from holiday_destination_finder.config import setup_logging
@@ -1,12 +1,49 @@
-import os, requests, json, time, logging
+import os, requests, json, time, logging, threading
 from datetime import date, timedelta
 from currency_converter import CurrencyConverter
 
 logger = logging.getLogger(__name__)
 
 _SESSION = requests.Session()
+# Default adapters keep only 10 pooled connections per host; with up to 30
+# provider threads in flight that silently discards keepalive connections
+# and pays a fresh TCP+TLS handshake on the next call
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=64))
 _CURRENCY_CONVERTER = CurrencyConverter()
 
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket pacing requests across all worker threads.
+    Unlike a fixed per-call sleep, idle capacity carries over (burst up to
+    ``capacity``), so underloaded runs never pay a flat latency tax while
+    saturated runs still stay under the provider's rate limit.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._ts = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._ts) * self._rate)
+                self._ts = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+# Amadeus test tier allows ~10 req/s; the bucket is shared by every thread
+_RATE_LIMITER = _TokenBucket(rate=10.0, capacity=10.0)
+
 _TOKEN_CACHE = {
     "access_token": None,
     "expires_at": 0,  # unix timestamp
@@ -106,6 +143,7 @@ def _get_with_retries(url, headers, params, timeout=15, max_retries=3, base_slee
     last_exc = None
 
     for attempt in range(max_retries + 1):
+        _RATE_LIMITER.acquire()
         resp = _SESSION.get(url, headers=headers, params=params, timeout=timeout)
 
         # Success
@@ -205,7 +243,7 @@ def get_cheapest_offer_for_dates(origin, destination, from_date, to_date, trip_l
 
 
 
-def get_best_offer_in_window(origin: str, destination: str, from_date: str, to_date: str, trip_length: int, sleep_s: float = 0.0):
+def get_best_offer_in_window(origin: str, destination: str, from_date: str, to_date: str, trip_length: int):
     start_dt = date.fromisoformat(from_date)
     end_dt = date.fromisoformat(to_date)
 
@@ -233,10 +271,6 @@ def get_best_offer_in_window(origin: str, destination: str, from_date: str, to_d
 
         logger.debug(f"[amadeus] checked dep={dep} ret={ret} -> price={'None' if price is None else price}")
 
-
-        if sleep_s:
-            time.sleep(sleep_s)
-
         d += timedelta(days=1)
 
     logger.info(f"[amadeus] finished window search | offers_found: {len(offers)}")
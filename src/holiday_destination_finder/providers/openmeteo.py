@@ -1,10 +1,66 @@
+import os
+import json
+import sqlite3
+import threading
 import time
 import requests
 from datetime import date, timedelta
 
 _SESSION = requests.Session()
+# Size the keepalive pool for the worker-thread fan-out; the default of 10
+# discards and re-handshakes connections once more threads are in flight
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=64))
 _CACHE = {}
 
+# L2 disk cache: identical (lat, lon, window) lookups recur across runs and
+# across worker restarts, and OpenMeteo answers are stable - climate-model
+# data effectively forever, forecasts for a few hours
+_DISK_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "holiday-destination-finder", "weather.sqlite3"
+)
+_DISK_TTL_S = {"climate": 30 * 86400, "forecast": 6 * 3600}
+_disk_conn = None
+_disk_lock = threading.Lock()
+
+
+def _disk_cache():
+    global _disk_conn
+    if _disk_conn is None:
+        os.makedirs(os.path.dirname(_DISK_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(_DISK_CACHE_PATH, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS weather (key TEXT PRIMARY KEY, value TEXT, ts REAL)"
+        )
+        conn.commit()
+        _disk_conn = conn
+    return _disk_conn
+
+
+def _disk_get(key: tuple, source: str):
+    try:
+        with _disk_lock:
+            row = _disk_cache().execute(
+                "SELECT value, ts FROM weather WHERE key = ?", (repr(key),)
+            ).fetchone()
+        if row and time.time() - row[1] < _DISK_TTL_S[source]:
+            return json.loads(row[0])
+    except Exception:
+        # A broken cache file must never break weather lookups
+        pass
+    return None
+
+
+def _disk_put(key: tuple, result: dict):
+    try:
+        with _disk_lock:
+            _disk_cache().execute(
+                "INSERT OR REPLACE INTO weather (key, value, ts) VALUES (?, ?, ?)",
+                (repr(key), json.dumps(result), time.time()),
+            )
+            _disk_cache().commit()
+    except Exception:
+        pass
+
 def _get_json_with_retries(url: str, *, retries: int = 3, timeout=(5, 30)):
     last_exc = None
     for attempt in range(retries):
@@ -38,6 +94,11 @@ def get_weather_data(lat, lon, start_date, end_date):
     if key in _CACHE:
         return _CACHE[key]
 
+    cached = _disk_get(key, source)
+    if cached is not None:
+        _CACHE[key] = cached
+        return cached
+
     data = _get_json_with_retries(url, retries=3, timeout=(5, 30))
 
     temps_max = data["daily"]["temperature_2m_max"]
@@ -62,5 +123,6 @@ def get_weather_data(lat, lon, start_date, end_date):
         "source": source
     }
     _CACHE[key] = result
+    _disk_put(key, result)
 
     return result
\ No newline at end of file
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def total_score(weather_data, flight_price, total_stops, min_price, max_price) -> float:
     p = price_score(float(flight_price), min_price, max_price) * stop_penalty(total_stops)
     w = weather_score(weather_data)
@@ -43,4 +46,30 @@ def weather_score(weather):
 
 def stop_penalty(total_stops: int) -> float:
     total_stops = max(0, int(total_stops))
-    return max(0.5, 1.0 - 0.1 * total_stops)
\ No newline at end of file
+    return max(0.5, 1.0 - 0.1 * total_stops)
+
+
+def total_score_batch(weather_list, prices, stops, min_price, max_price):
+    """
+    Vectorized total_score over whole result lists, used for the final
+    renormalization pass against the global price range. Must stay in sync
+    with the scalar functions above.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    stops = np.maximum(np.asarray(stops, dtype=np.float64), 0.0)
+    temps = np.array([w["avg_temp_c"] for w in weather_list], dtype=np.float64)
+    rains = np.array([w["avg_precip_mm_per_day"] for w in weather_list], dtype=np.float64)
+
+    if max_price == min_price:
+        p = np.full_like(prices, 100.0)
+    else:
+        norm = np.clip((prices - min_price) / (max_price - min_price), 0.0, 1.0)
+        p = 100.0 - 50.0 * norm
+    p *= np.maximum(0.5, 1.0 - 0.1 * stops)
+
+    temp_score = np.maximum(0.0, 100.0 - 3.0 * np.abs(temps - 26.0))
+    effective_rain = np.where(rains < 0.2, 0.0, np.where(rains < 1.0, 0.5, rains))
+    rain_score = np.maximum(0.0, 100.0 - effective_rain * 15.0)
+    w = 0.6 * temp_score + 0.4 * rain_score
+
+    return 0.4 * p + 0.6 * w
\ No newline at end of file
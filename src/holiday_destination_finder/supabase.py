@@ -189,6 +189,56 @@ def get_search_results_by_client(client_id: str) -> List[Dict[str, Any]]:
         return []
 
 
+def get_search_results_by_clients(client_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Batched version of get_search_results_by_client: fetch Personal-tab searches
+    for many clients in a single IN query (used by the request-coalescing loader).
+
+    Args:
+        client_ids: List of client identifiers
+
+    Returns:
+        Dict mapping each client_id to its (non-hidden) search results,
+        sorted by last_accessed_at DESC
+    """
+    if _supabase is None or not client_ids:
+        return {}
+
+    try:
+        # One query for all clients' jobs, one for all their hidden job IDs
+        response = _supabase.table("search_results")\
+            .select("*")\
+            .in_("client_id", client_ids)\
+            .order("last_accessed_at", desc=True)\
+            .execute()
+
+        hidden_response = _supabase.table("hidden_searches")\
+            .select("client_id, job_id")\
+            .in_("client_id", client_ids)\
+            .execute()
+
+        hidden_pairs = {(item["client_id"], item["job_id"]) for item in hidden_response.data}
+
+        results: Dict[str, List[Dict[str, Any]]] = {client_id: [] for client_id in client_ids}
+        for item in response.data:
+            client_id = item.get("client_id")
+            # Skip hidden jobs
+            if (client_id, item["job_id"]) in hidden_pairs:
+                continue
+
+            # Parse JSON fields
+            if isinstance(item.get("params"), str):
+                item["params"] = json.loads(item["params"])
+            if isinstance(item.get("result"), str):
+                item["result"] = json.loads(item["result"])
+            results.setdefault(client_id, []).append(item)
+
+        return results
+    except Exception as e:
+        logger.error(f"[supabase] Failed to get search results for {len(client_ids)} clients: {e}")
+        return {}
+
+
 def get_saved_searches_by_client(client_id: str) -> List[Dict[str, Any]]:
     """
     Get all searches saved by a client_id (Shared tab), excluding deleted ones.
@@ -234,6 +284,55 @@ def get_saved_searches_by_client(client_id: str) -> List[Dict[str, Any]]:
         return []
 
 
+def get_saved_searches_by_clients(client_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Batched version of get_saved_searches_by_client: fetch Shared-tab searches
+    for many clients in a single IN query (used by the request-coalescing loader).
+
+    Args:
+        client_ids: List of client identifiers
+
+    Returns:
+        Dict mapping each client_id to its saved searches (with per-user
+        custom_name), sorted by saved_at DESC
+    """
+    if _supabase is None or not client_ids:
+        return {}
+
+    try:
+        # Join saved_searches with search_results for all clients at once
+        response = _supabase.table("saved_searches")\
+            .select("client_id, custom_name, saved_at, search_results(*)")\
+            .in_("client_id", client_ids)\
+            .is_("deleted_at", "null")\
+            .order("saved_at", desc=True)\
+            .execute()
+
+        results: Dict[str, List[Dict[str, Any]]] = {client_id: [] for client_id in client_ids}
+        for item in response.data:
+            client_id = item.get("client_id")
+            search_result = item.get("search_results")
+            if not search_result:
+                continue
+
+            # Parse JSON fields
+            if isinstance(search_result.get("params"), str):
+                search_result["params"] = json.loads(search_result["params"])
+            if isinstance(search_result.get("result"), str):
+                search_result["result"] = json.loads(search_result["result"])
+
+            # Override custom_name with per-user custom_name from saved_searches
+            if item.get("custom_name"):
+                search_result["custom_name"] = item["custom_name"]
+
+            results.setdefault(client_id, []).append(search_result)
+
+        return results
+    except Exception as e:
+        logger.error(f"[supabase] Failed to get saved searches for {len(client_ids)} clients: {e}")
+        return {}
+
+
 def save_search_for_client(client_id: str, job_id: str) -> bool:
     """
     Add a search to a user's saved list.
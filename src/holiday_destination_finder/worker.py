@@ -1,23 +1,20 @@
-import os, json, traceback
-import redis
+import json, traceback
 import time
 import logging
 
-from holiday_destination_finder.kv_queue import QUEUE, set_running, set_done, set_failed, set_progress, get_job
+from holiday_destination_finder._redis import r
+from holiday_destination_finder.kv_queue import QUEUE, dequeue, set_running, set_done, set_failed, set_progress, get_job
 from holiday_destination_finder.main import search_destinations
 
 logger = logging.getLogger(__name__)
 
-r = redis.Redis.from_url(os.environ["REDIS_URL"], decode_responses=True)
-
 def main():
     while True:
-        item = r.blpop(QUEUE, timeout=10)
-        if not item:
+        job_id = dequeue(timeout=10)
+        if not job_id:
             continue
 
-        _, job_id = item
-        
+
         # Check if job was cancelled before we start processing
         job_data = get_job(job_id)
         if not job_data or job_data.get("status") == "cancelled":